@@ -0,0 +1,21 @@
+"""
+ASGI entry point, served by uvicorn workers:
+
+    gunicorn azayd.asgi:application -k uvicorn.workers.UvicornWorker
+
+I/O-bound endpoints switch to their async variants (website.async_views), so
+one worker process can keep many slow upstream and database waits in flight.
+"""
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'azayd.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', 'True')
+
+application = get_asgi_application()
+
+# Compile templates before the first request reaches this worker. Database
+# connections are per thread, so they are not pre-opened here.
+from website.warmup import warm_templates  # noqa: E402
+
+warm_templates()
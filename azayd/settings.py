@@ -69,6 +69,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'website.middleware.SecurityHeadersMiddleware',
+    'website.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'azayd.urls'
@@ -76,9 +77,17 @@ ROOT_URLCONF = 'azayd.urls'
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR / 'templates', BASE_DIR],
-        'APP_DIRS': True,
+        # Only the templates/ directory; the project root holds unrelated HTML/JS
+        'DIRS': [BASE_DIR / 'templates'],
         'OPTIONS': {
+            # Compiled templates are kept in memory per worker and warmed at
+            # boot by website.warmup.warm_templates (see azayd/wsgi.py)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -91,20 +100,102 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'azayd.wsgi.application'
+ASGI_APPLICATION = 'azayd.asgi.application'
+
+# Serve I/O-bound endpoints (Gemini proxy, health check, job lists) with async
+# views. azayd/asgi.py turns this on; under WSGI the sync views are used.
+USE_ASYNC_VIEWS = os.getenv('DJANGO_ASYNC_VIEWS', 'False') == 'True'
 
 # --- FIXED DATABASE CONFIGURATION ---
 # This block correctly uses the DATABASE_URL environment variable for production
 # and adds necessary options for cloud databases.
+#
+# When DATABASE_POOLER_URL is set (a PgBouncer-style pooler in transaction mode,
+# e.g. the `pgbouncer` service in docker-compose.yml), Django connects through
+# it instead and server-side cursors are disabled, as transaction pooling requires.
+DATABASE_POOLER_URL = os.getenv('DATABASE_POOLER_URL')
+
 DATABASES = {
     'default': dj_database_url.config(
-        # Use the DATABASE_URL from your .env file or Vercel environment variables
-        default=os.environ.get('DATABASE_URL'),
-        # These settings are good for production database connections
-        conn_max_age=600,
-        ssl_require=True
+        # Use the DATABASE_URL from your .env file or Vercel environment variables,
+        # or the pooler in front of it when one is configured
+        env='DATABASE_POOLER_URL' if DATABASE_POOLER_URL else 'DATABASE_URL',
+        # Keep connections open between requests, but check them before reuse so
+        # a connection dropped by the server or pooler is replaced, not raised
+        conn_max_age=int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        conn_health_checks=True,
+        ssl_require=os.getenv('DB_SSL_REQUIRE', 'True') == 'True'
     )
 }
 
+if DATABASE_POOLER_URL:
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+# Streaming exports (website.exports) rely on server-side cursors to run in
+# constant memory, which transaction pooling rules out. Behind a pooler they
+# connect straight to DATABASE_URL through this alias instead; without
+# DATABASE_URL they fall back to the pooler and buffer each chunk client-side.
+DATABASE_DIRECT_ALIAS = 'default'
+if DATABASE_POOLER_URL and os.environ.get('DATABASE_URL'):
+    DATABASES['direct'] = dj_database_url.parse(
+        os.environ['DATABASE_URL'],
+        conn_max_age=0,
+        ssl_require=os.getenv('DB_SSL_REQUIRE', 'True') == 'True'
+    )
+    DATABASES['direct']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_DIRECT_ALIAS = 'direct'
+
+# Read replicas: comma-separated database URLs. Safe API requests read from a
+# random replica (website.db_router); a client that just wrote stays on the
+# primary for DATABASE_REPLICA_STICKY_SECONDS.
+DATABASE_REPLICAS = []
+for index, replica_url in enumerate(filter(None, os.getenv('DATABASE_REPLICA_URLS', '').split(',')), start=1):
+    alias = f'replica_{index}'
+    DATABASES[alias] = dj_database_url.parse(
+        replica_url.strip(),
+        conn_max_age=DATABASES['default'].get('CONN_MAX_AGE', 0),
+        conn_health_checks=True,
+        ssl_require=os.getenv('DB_SSL_REQUIRE', 'True') == 'True'
+    )
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['website.db_router.ReplicaRouter']
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv('DATABASE_REPLICA_STICKY_SECONDS', '15'))
+
+# Open a connection in each worker at boot (see website.warmup)
+DB_WARM_CONNECTIONS = os.getenv('DB_WARM_CONNECTIONS', 'True') == 'True'
+
+# Cache
+# Template fragments, statistics and cached lists use Redis when REDIS_URL is
+# set; otherwise each worker process caches locally. Their keys include model
+# version stamps (website.fragment_cache), which live in the 'versions' alias:
+# Redis too when available, else a database table, so a save invalidates the
+# caches of every worker and host either way. Duplicate-submission
+# fingerprints (website.spam) are kept there for the same reason.
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        },
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        # Table created by migration website.0019_version_cache_table
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'website_version_cache',
+        },
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -169,16 +260,30 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'website.throttling.SlidingWindowAnonRateThrottle',
+        'website.throttling.SlidingWindowUserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
         'user': '1000/day',
         'contact': '5/hour',
+        'submission_burst': '3/min',
+        'suggest': '60/min',
     },
 }
 
+# Rate limiting
+# Throttle counters are kept in the database so limits hold across all workers.
+# Use 'website.throttling.LocalCounterStore' for tests or single-process development.
+RATE_LIMIT_STORE = os.getenv('RATE_LIMIT_STORE', 'website.throttling.DatabaseCounterStore')
+
+# Resume text extraction
+# New uploads are parsed by a process pool on a background thread of the web
+# worker. Set RESUME_EXTRACTION_IN_PROCESS=False to leave it to a scheduled
+# `manage.py extract_resume_text` run instead.
+RESUME_EXTRACTION_IN_PROCESS = os.getenv('RESUME_EXTRACTION_IN_PROCESS', 'True') == 'True'
+RESUME_EXTRACTION_WORKERS = int(os.getenv('RESUME_EXTRACTION_WORKERS', '2'))
+
 # Security settings for production
 # Using os.getenv to make these configurable is a good practice
 SECURE_BROWSER_XSS_FILTER = True
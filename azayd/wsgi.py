@@ -3,4 +3,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'azayd.settings')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Compile templates before the first request reaches this worker. Database
+# connections are opened per worker thread in gunicorn's post_worker_init
+# hook, so the preloading master holds none to hand down to forked workers.
+from website.warmup import warm_templates  # noqa: E402
+
+warm_templates()
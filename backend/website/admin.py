@@ -1,5 +1,68 @@
 from django.contrib import admin
-from .models import Service, JobPosting, TeamMember, ContactMessage, ResumeSubmission, JobApplication
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from .models import Service, JobPosting, TeamMember, Skill, ContactMessage, ResumeSubmission, JobApplication, StatusChange, Candidate, email_digest
+from .workflow import transition_status
+from .applicant_search import search_applicants
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the Postgres planner estimate for unfiltered changelists.
+
+    An exact COUNT(*) over a large table is a sequential scan; pg_class.reltuples
+    is kept up to date by autovacuum and is good enough for page links. Filtered
+    querysets and other database backends fall back to the exact count.
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            connection = connections[self.object_list.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples FROM pg_class WHERE relname = %s",
+                        [self.object_list.model._meta.db_table]
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.estimate_threshold:
+                    return int(row[0])
+        return super().count
+
+
+def status_actions(model):
+    """Build one bulk action per status choice, each applied as a single audited UPDATE."""
+    actions = []
+    for value, label in model._meta.get_field('status').choices:
+        def set_status(modeladmin, request, queryset, value=value, label=label):
+            result = transition_status(queryset, value, user=request.user, enforce_workflow=False)
+            modeladmin.message_user(request, f'{len(result["updated"])} records moved to "{label}".')
+        set_status.__name__ = f'set_status_{value}'
+        set_status.short_description = f'Set status to "{label}"'
+        actions.append(set_status)
+    return actions
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist defaults for tables that grow without bound."""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+
+
+class ApplicantSearchAdmin(LargeTableAdmin):
+    """Changelist search answered from the applicant full-text index, resume text included."""
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        matches = search_applicants(search_term, models=[self.model], limit=1000)
+        return queryset.filter(pk__in=[pk for _, pk, _, _ in matches]), False
+
 
 @admin.register(Service)
 class ServiceAdmin(admin.ModelAdmin):
@@ -9,7 +72,10 @@ class ServiceAdmin(admin.ModelAdmin):
 
 @admin.register(JobPosting)
 class JobPostingAdmin(admin.ModelAdmin):
-    list_display = ('title', 'department', 'location', 'job_type', 'is_active', 'created_at')
+    list_display = (
+        'title', 'department', 'location', 'job_type', 'is_active',
+        'application_count', 'new_application_count', 'recent_application_count', 'created_at'
+    )
     list_filter = ('is_active', 'department', 'location', 'job_type')
     prepopulated_fields = {'slug': ('title',)}
     search_fields = ('title', 'description', 'requirements')
@@ -23,53 +89,69 @@ class JobPostingAdmin(admin.ModelAdmin):
         ('Status', {
             'fields': ('is_active',)
         }),
+        ('Applications', {
+            'fields': ('application_count', 'new_application_count', 'recent_application_count')
+        }),
         ('Metadata', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'application_count', 'new_application_count', 'recent_application_count')
 
 @admin.register(TeamMember)
 class TeamMemberAdmin(admin.ModelAdmin):
-    list_display = ('name', 'position', 'is_active', 'order')
-    list_filter = ('is_active',)
+    list_display = ('name', 'position', 'is_leadership', 'seniority', 'is_active', 'order')
+    list_filter = ('is_active', 'is_leadership', 'leadership_override')
     search_fields = ('name', 'position', 'bio')
+    readonly_fields = ('is_leadership', 'seniority')
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ('name', 'member_count')
+    search_fields = ('name',)
+    readonly_fields = ('key', 'name', 'member_count')
+
+    def has_add_permission(self, request):
+        return False
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(LargeTableAdmin):
     list_display = ('name', 'email', 'subject', 'created_at', 'is_read')
     list_filter = ('is_read', 'created_at')
     search_fields = ('name', 'email', 'subject', 'message')
 
 @admin.register(ResumeSubmission)
-class ResumeSubmissionAdmin(admin.ModelAdmin):
+class ResumeSubmissionAdmin(ApplicantSearchAdmin):
     list_display = ('name', 'email', 'created_at', 'status', 'is_reviewed')
-    list_filter = ('status', 'is_reviewed', 'created_at')
+    list_filter = ('status', 'is_reviewed', 'resume_text_status', 'created_at')
     search_fields = ('name', 'email', 'message', 'notes')
-    readonly_fields = ('created_at',)
+    readonly_fields = ('created_at', 'source', 'candidate', 'resume_text_status', 'resume_text')
     fieldsets = (
         ('Applicant Information', {
             'fields': ('name', 'email', 'phone', 'message')
         }),
         ('Resume', {
-            'fields': ('resume_file', 'resume_link')
+            'fields': ('resume_file', 'resume_link', 'resume_text_status', 'resume_text')
         }),
         ('Status', {
             'fields': ('status', 'is_reviewed', 'notes')
         }),
         ('Metadata', {
-            'fields': ('created_at',),
+            'fields': ('created_at', 'source', 'candidate'),
             'classes': ('collapse',)
         }),
     )
+    actions = status_actions(ResumeSubmission)
 
 @admin.register(JobApplication)
-class JobApplicationAdmin(admin.ModelAdmin):
+class JobApplicationAdmin(ApplicantSearchAdmin):
     list_display = ('name', 'email', 'job', 'created_at', 'status', 'is_reviewed', 'email_sent')
-    list_filter = ('status', 'is_reviewed', 'email_sent', 'created_at')
+    list_filter = ('status', 'is_reviewed', 'email_sent', 'resume_text_status', 'created_at')
+    list_select_related = ('job',)
     search_fields = ('name', 'email', 'cover_letter', 'notes', 'job__title')
-    readonly_fields = ('created_at', 'email_sent')
+    autocomplete_fields = ('job',)
+    readonly_fields = ('created_at', 'source', 'candidate', 'email_sent', 'resume_text_status', 'resume_text')
     fieldsets = (
         ('Job Information', {
             'fields': ('job',)
@@ -78,18 +160,18 @@ class JobApplicationAdmin(admin.ModelAdmin):
             'fields': ('name', 'email', 'phone', 'cover_letter')
         }),
         ('Resume', {
-            'fields': ('resume_file', 'resume_link')
+            'fields': ('resume_file', 'resume_link', 'resume_text_status', 'resume_text')
         }),
         ('Status', {
             'fields': ('status', 'is_reviewed', 'notes', 'email_sent')
         }),
         ('Metadata', {
-            'fields': ('created_at',),
+            'fields': ('created_at', 'source', 'candidate'),
             'classes': ('collapse',)
         }),
     )
     
-    actions = ['mark_as_reviewed', 'send_confirmation_email']
+    actions = ['mark_as_reviewed', 'send_confirmation_email', *status_actions(JobApplication)]
     
     def mark_as_reviewed(self, request, queryset):
         queryset.update(is_reviewed=True)
@@ -99,7 +181,8 @@ class JobApplicationAdmin(admin.ModelAdmin):
         from django.core.mail import send_mail
         from django.conf import settings
         
-        for application in queryset.filter(email_sent=False):
+        sent_ids = []
+        for application in queryset.filter(email_sent=False).select_related('job'):
             try:
                 job_title = application.job.title if application.job else "our company"
                 send_mail(
@@ -109,10 +192,43 @@ class JobApplicationAdmin(admin.ModelAdmin):
                     [application.email],
                     fail_silently=False,
                 )
-                application.email_sent = True
-                application.save()
+                sent_ids.append(application.pk)
             except Exception as e:
                 self.message_user(request, f"Error sending email to {application.email}: {str(e)}", level='error')
         
-        self.message_user(request, f"Confirmation emails sent to {queryset.filter(email_sent=True).count()} applicants.")
-    send_confirmation_email.short_description = "Send confirmation email to selected applicants"
\ No newline at end of file
+        JobApplication.objects.filter(pk__in=sent_ids).update(email_sent=True)
+        self.message_user(request, f"Confirmation emails sent to {len(sent_ids)} applicants.")
+    send_confirmation_email.short_description = "Send confirmation email to selected applicants"
+
+@admin.register(StatusChange)
+class StatusChangeAdmin(LargeTableAdmin):
+    list_display = ('model_name', 'object_id', 'from_status', 'to_status', 'changed_by', 'created_at')
+    list_filter = ('model_name', 'to_status', 'created_at')
+    list_select_related = ('changed_by',)
+    search_fields = ('note',)
+    readonly_fields = ('model_name', 'object_id', 'from_status', 'to_status', 'changed_by', 'note', 'created_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+@admin.register(Candidate)
+class CandidateAdmin(LargeTableAdmin):
+    list_display = ('email', 'name', 'application_count', 'resume_count', 'latest_status', 'last_activity_at')
+    list_filter = ('latest_status',)
+    search_fields = ('email', 'name')
+    readonly_fields = (
+        'email_hash', 'email', 'name', 'application_count', 'resume_count',
+        'latest_status', 'last_activity_at', 'created_at'
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_search_results(self, request, queryset, search_term):
+        # A full address is one lookup on the unique hash
+        if '@' in search_term:
+            return queryset.filter(email_hash=email_digest(search_term)), False
+        return super().get_search_results(request, queryset, search_term)
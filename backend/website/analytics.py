@@ -0,0 +1,137 @@
+import re
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDate
+
+from .models import JobApplication, JobPosting, ResumeSubmission, StatusChange, SubmissionRollup
+
+
+# === Submission Analytics ===
+#
+# The dashboard never scans submissions: it reads the SubmissionRollup rows of
+# the requested date range, which are kept current on every insert and status
+# change, so its cost depends on the number of days, jobs and sources shown
+# rather than on how many submissions have ever been received.
+
+ANALYTICS_TYPES = {
+    'applications': JobApplication,
+    'resumes': ResumeSubmission,
+}
+
+DEFAULT_DAYS = 30
+MAX_DAYS = 366
+
+DIRECT_SOURCE = 'direct'
+
+
+def first_party_hosts():
+    """Hosts of our own frontends (CORS and CSRF trusted origins); they refer no traffic."""
+    origins = [*getattr(settings, 'CORS_ALLOWED_ORIGINS', []), *getattr(settings, 'CSRF_TRUSTED_ORIGINS', [])]
+    return {urlsplit(origin.strip()).hostname for origin in origins} - {None}
+
+
+def submission_source(request):
+    """
+    Where a submission came from: an explicit ``source`` field, the page's
+    ``utm_source``, the referring host, or 'direct'. Referrals from this site
+    or its own frontends count as direct.
+    """
+    source = request.data.get('source') or request.query_params.get('utm_source')
+    if not source:
+        referer = request.META.get('HTTP_REFERER', '')
+        host = urlsplit(referer).hostname or ''
+        if host and host != request.get_host().split(':')[0] and host not in first_party_hosts():
+            source = host.removeprefix('www.')
+    source = re.sub(r'[^a-z0-9._-]+', '-', str(source or '').strip().lower()).strip('-')
+    return source[:50] or DIRECT_SOURCE
+
+
+def dashboard(model, start, end, job_id=None):
+    """
+    Funnel and daily series of ``model`` submissions between ``start`` and
+    ``end`` (inclusive), from one range query on the rollup table.
+
+    The funnel counts the submissions entering each status in the period; the
+    series, job and source breakdowns count received ('new') submissions.
+    """
+    rows = SubmissionRollup.objects.filter(
+        model_name=model._meta.model_name, date__range=(start, end)
+    )
+    if job_id is not None:
+        rows = rows.filter(job_id=job_id)
+    rows = rows.values('date', 'job_id', 'status', 'source').annotate(total=Sum('count')).order_by()
+
+    statuses = [choice for choice, _ in model._meta.get_field('status').choices]
+    funnel = dict.fromkeys(statuses, 0)
+    series = {start + timedelta(days=offset): dict.fromkeys(statuses, 0) for offset in range((end - start).days + 1)}
+    jobs = {}
+    sources = {}
+    for row in rows:
+        funnel[row['status']] = funnel.get(row['status'], 0) + row['total']
+        day = series[row['date']]
+        day[row['status']] = day.get(row['status'], 0) + row['total']
+        if row['status'] == 'new':
+            jobs[row['job_id']] = jobs.get(row['job_id'], 0) + row['total']
+            sources[row['source'] or DIRECT_SOURCE] = sources.get(row['source'] or DIRECT_SOURCE, 0) + row['total']
+
+    received = funnel.get('new', 0)
+    titles = dict(JobPosting.objects.filter(pk__in=[pk for pk in jobs if pk]).values_list('pk', 'title')) if jobs else {}
+    return {
+        'from': start.isoformat(),
+        'to': end.isoformat(),
+        'funnel': [
+            {'status': name, 'count': count, 'rate': round(count / received, 4) if received else None}
+            for name, count in funnel.items()
+        ],
+        'series': [{'date': day.isoformat(), **counts} for day, counts in series.items()],
+        'jobs': [
+            {'id': pk or None, 'title': titles.get(pk), 'count': count}
+            for pk, count in sorted(jobs.items(), key=lambda item: -item[1])
+        ],
+        'sources': [
+            {'source': name, 'count': count}
+            for name, count in sorted(sources.items(), key=lambda item: -item[1])
+        ],
+    }
+
+
+def rebuild_rollups():
+    """
+    Recompute every rollup row from the submissions and their StatusChange
+    history. Status edits made outside the workflow leave no audit trail, so
+    only their incremental counts are lost on rebuild. Returns the row count.
+    """
+    counts = {}
+
+    def add(model, day, job_id, status, source, count):
+        key = (model._meta.model_name, day, job_id or 0, status, source or '')
+        counts[key] = counts.get(key, 0) + count
+
+    for model in ANALYTICS_TYPES.values():
+        job_field = 'job_id' if model is JobApplication else None
+        fields = ['day', 'source'] + ([job_field] if job_field else [])
+
+        received = model.objects.annotate(day=TruncDate('created_at')).values(*fields).annotate(total=Count('id')).order_by()
+        for row in received:
+            add(model, row['day'], row.get(job_field), 'new', row['source'], row['total'])
+
+        submission = model.objects.filter(pk=OuterRef('object_id'))
+        changes = StatusChange.objects.filter(model_name=model._meta.model_name).annotate(
+            day=TruncDate('created_at'),
+            source=Subquery(submission.values('source')[:1]),
+            **({job_field: Subquery(submission.values(job_field)[:1])} if job_field else {}),
+        ).filter(source__isnull=False)
+        for row in changes.values('to_status', *fields).annotate(total=Count('id')).order_by():
+            add(model, row['day'], row.get(job_field), row['to_status'], row['source'], row['total'])
+
+    with transaction.atomic():
+        SubmissionRollup.objects.all().delete()
+        SubmissionRollup.objects.bulk_create([
+            SubmissionRollup(model_name=model_name, date=day, job_id=job_id, status=status, source=source, count=count)
+            for (model_name, day, job_id, status, source), count in counts.items()
+        ], batch_size=1000)
+    return len(counts)
@@ -1,9 +1,8 @@
 from rest_framework import viewsets, filters, status
-from rest_framework.decorators import api_view, permission_classes, action, parser_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.decorators import api_view, permission_classes, action, parser_classes, throttle_classes
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
 from django.views.decorators.cache import cache_page
@@ -12,18 +11,34 @@ from django.utils import timezone
 from django.db import models
 from django.db.models import Avg, Count, Q
 from django.core.cache import cache
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
 import logging
 import json
 import re
+from datetime import date, timedelta
 
-from .models import Service, TeamMember, JobPosting, ContactMessage, ResumeSubmission, JobApplication
+from .models import Service, TeamMember, TeamMemberSkill, JobPosting, ContactMessage, ResumeSubmission, JobApplication, Candidate, email_digest
 from .serializers import (
     ServiceSerializer, ServiceDetailSerializer,
     TeamMemberSerializer, JobPostingSerializer, ContactMessageSerializer,
     ResumeSubmissionSerializer, JobApplicationSerializer
 )
+from .exports import ExportError, build_export_queryset, iter_export, export_content_type
+from .workflow import WorkflowError, transition_by_ids
+from .throttling import SlidingWindowAnonRateThrottle, SlidingWindowUserRateThrottle
+from .spam import prefilter_submission, remember_submission
+from .batch import BatchError, resolve_batch
+from .related import related_objects
+from .people_search import PeopleSearchFilter
+from .team import get_active_members, get_highlights, get_leadership, get_skill_facets
+from .suggest import suggest
+from .spelling import TypoTolerantSearchFilter, add_correction_hint
+from .job_search import facet_values, search_jobs
+from .matching import matched_terms, rank, skills_text, text_vector, words
+from .applicant_search import SEARCH_TYPES, indexed_terms, search_applicants
+from .analytics import ANALYTICS_TYPES, DEFAULT_DAYS, MAX_DAYS, dashboard, submission_source
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -51,7 +66,7 @@ class StandardResultsSetPagination(PageNumberPagination):
         })
 
 
-class ContactRateThrottle(AnonRateThrottle):
+class ContactRateThrottle(SlidingWindowAnonRateThrottle):
     """
     Custom throttle for contact form submissions.
     """
@@ -59,6 +74,14 @@ class ContactRateThrottle(AnonRateThrottle):
     rate = '5/hour'  # Allow 5 contact submissions per hour
 
 
+class SuggestRateThrottle(SlidingWindowAnonRateThrottle):
+    """
+    Burst limit for search-as-you-type suggestions, which are requested on
+    every keystroke and so need a per-minute rather than a daily budget.
+    """
+    scope = 'suggest'
+
+
 class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Enhanced API endpoint for services with advanced filtering, search, and caching.
@@ -75,12 +98,11 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ServiceSerializer
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description', 'tech_stack', 'short_description']
-    filterset_fields = ['is_featured']
+    filter_backends = [DjangoFilterBackend, TypoTolerantSearchFilter, filters.OrderingFilter]
+    search_fields = ['title', 'description', 'tech_stack']
     ordering_fields = ['created_at', 'title', 'price', 'updated_at']
     ordering = ['-created_at']
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [SlidingWindowUserRateThrottle, SlidingWindowAnonRateThrottle]
     
     def get_queryset(self):
         """
@@ -90,7 +112,6 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
         - Category filtering by tech stack
         - Price range filtering
         - Featured services filtering
-        - Search term filtering
         """
         queryset = Service.objects.select_related().prefetch_related()
         
@@ -126,17 +147,7 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
             except (ValueError, TypeError):
                 pass
         
-        # Advanced search with fuzzy matching
-        search_term = self.request.query_params.get('search', None)
-        if search_term:
-            from django.db.models import Q
-            queryset = queryset.filter(
-                Q(title__icontains=search_term) |
-                Q(description__icontains=search_term) |
-                Q(short_description__icontains=search_term) |
-                Q(tech_stack__icontains=search_term)
-            )
-        
+        # ?search= is handled by TypoTolerantSearchFilter
         return queryset.order_by('-created_at')
     
     def get_serializer_class(self):
@@ -152,7 +163,7 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Cached list view for services.
         """
-        return super().list(request, *args, **kwargs)
+        return add_correction_hint(request, super().list(request, *args, **kwargs))
     
     @action(detail=False, methods=['get'])
     def featured(self, request):
@@ -206,6 +217,19 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=True, methods=['get'])
+    def related(self, request, pk=None):
+        """
+        Get services with a similar tech stack.
+        """
+        service = self.get_object()
+        serializer = self.get_serializer(related_objects(service), many=True)
+        return Response({
+            'status': 'success',
+            'data': serializer.data,
+            'count': len(serializer.data)
+        })
+    
     @action(detail=False, methods=['get'])
     def categories(self, request):
         """
@@ -382,6 +406,15 @@ def contact_submission(request):
     """
     if request.method == 'POST':
         try:
+            # Reject spam and duplicates before any validation or write
+            rejection = prefilter_submission(request, 'contact', 'message')
+            if rejection:
+                logger.warning(f"Submission rejected by prefilter ({rejection.reason})")
+                return Response(
+                    {'status': 'error', 'message': rejection.message},
+                    status=rejection.status_code
+                )
+            
             # Apply rate limiting
             throttle = ContactRateThrottle()
             if not throttle.allow_request(request, None):
@@ -399,6 +432,7 @@ def contact_submission(request):
             if serializer.is_valid():
                 # Save the contact message
                 contact_message = serializer.save()
+                remember_submission(request)
                 
                 # Log successful submission
                 logger.info(f"Contact message submitted: {contact_message.id} from {contact_message.email}")
@@ -504,13 +538,7 @@ def team_leadership(request):
     Returns top-level team members for leadership display.
     """
     try:
-        from .models import TeamMember
-        
-        # Get leadership team (first 4 by order)
-        leadership = TeamMember.objects.filter(
-            is_active=True
-        ).order_by('order', 'name')[:4]
-        
+        leadership = get_leadership(limit=4)
         serializer = TeamMemberSerializer(leadership, many=True)
         
         return Response({
@@ -572,17 +600,11 @@ def job_departments(request):
     Returns list of departments with job counts.
     """
     try:
-        from .models import JobPosting
-        
-        departments = JobPosting.objects.filter(
-            is_active=True
-        ).values('department').annotate(
-            count=models.Count('id')
-        ).order_by('department')
+        departments = [{'department': value, 'count': count} for value, count in facet_values('department')]
         
         return Response({
             'status': 'success',
-            'data': list(departments),
+            'data': departments,
             'last_updated': timezone.now().isoformat()
         }, status=status.HTTP_200_OK)
         
@@ -608,17 +630,11 @@ def job_locations(request):
     Returns list of locations with job counts.
     """
     try:
-        from .models import JobPosting
-        
-        locations = JobPosting.objects.filter(
-            is_active=True
-        ).values('location').annotate(
-            count=models.Count('id')
-        ).order_by('location')
+        locations = [{'location': value, 'count': count} for value, count in facet_values('location')]
         
         return Response({
             'status': 'success',
-            'data': list(locations),
+            'data': locations,
             'last_updated': timezone.now().isoformat()
         }, status=status.HTTP_200_OK)
         
@@ -643,7 +659,9 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
     - List all active team members with pagination
     - Retrieve individual team member details
     - Advanced filtering by role, department, and skills
+      (?skills=python,django matches members with every listed skill)
     - Search functionality across name, position, and bio
+    - Fuzzy people search with ?q=, ranked by trigram similarity
     - Leadership filtering
     - Performance optimizations with caching
     - Modern REST API standards compliance
@@ -651,12 +669,12 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = TeamMemberSerializer
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, PeopleSearchFilter]
     search_fields = ['name', 'position', 'bio']
     filterset_fields = ['is_active', 'position']
     ordering_fields = ['order', 'name', 'position']
     ordering = ['order', 'name']
-    throttle_classes = [UserRateThrottle, AnonRateThrottle]
+    throttle_classes = [SlidingWindowUserRateThrottle, SlidingWindowAnonRateThrottle]
     
     def get_queryset(self):
         """
@@ -668,7 +686,12 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         - Leadership filtering
         - Active status filtering
         """
-        queryset = TeamMember.objects.filter(is_active=True)
+        queryset = TeamMember.objects.active().with_skills()
+        
+        # Skill filtering, an indexed join on the normalized skill links
+        skills = self.request.query_params.get('skills', None)
+        if skills:
+            queryset = queryset.with_all_skills(skills.split(','))
         
         # Role filtering
         role = self.request.query_params.get('role', None)
@@ -681,16 +704,8 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         # Leadership filtering
         leadership_only = self.request.query_params.get('leadership', None)
         if leadership_only and leadership_only.lower() == 'true':
-            # Assuming leadership is determined by position keywords
-            queryset = queryset.filter(
-                Q(position__icontains='director') |
-                Q(position__icontains='manager') |
-                Q(position__icontains='lead') |
-                Q(position__icontains='head') |
-                Q(position__icontains='ceo') |
-                Q(position__icontains='cto') |
-                Q(position__icontains='founder')
-            )
+            # Flag is derived from the position on save and indexed with order
+            queryset = queryset.filter(is_leadership=True)
         
         return queryset.order_by('order', 'name')
     
@@ -704,11 +719,8 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         # Add metadata to response
         if hasattr(response, 'data') and 'results' in response.data:
             response.data['metadata'] = {
-                'total_active_members': TeamMember.objects.filter(is_active=True).count(),
-                'leadership_count': TeamMember.objects.filter(
-                    is_active=True,
-                    position__regex=r'(director|manager|lead|head|ceo|cto|founder)'
-                ).count(),
+                'total_active_members': TeamMember.objects.active().count(),
+                'leadership_count': TeamMember.objects.leadership().count(),
                 'departments': list(TeamMember.objects.filter(
                     is_active=True
                 ).values_list('position', flat=True).distinct()),
@@ -718,7 +730,6 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         return response
     
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 10))  # Cache for 10 minutes
     def leadership(self, request):
         """
         Get leadership team members with enhanced information.
@@ -727,35 +738,16 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         additional metadata and achievements.
         """
         try:
-            # Get leadership members based on is_leadership field first, then position keywords
-            leadership = TeamMember.objects.filter(
-                is_active=True,
-                is_leadership=True
-            ).order_by('order', 'name')[:8]
-            
-            # If no leadership found by flag, try position keywords
-            if not leadership.exists():
-                leadership = TeamMember.objects.filter(
-                    is_active=True,
-                    position__iregex=r'(director|manager|lead|head|ceo|cto|founder|chief)'
-                ).order_by('order', 'name')[:8]
-            
-            # Final fallback to first 4 by order
-            if not leadership.exists():
-                leadership = TeamMember.objects.filter(
-                    is_active=True
-                ).order_by('order', 'name')[:4]
-            
+            leadership = get_leadership()
             serializer = TeamMemberSerializer(leadership, many=True)
             
             return Response({
                 'status': 'success',
-                'count': leadership.count(),
+                'count': len(leadership),
                 'results': serializer.data,
                 'metadata': {
-                    'total_leadership': leadership.count(),
+                    'total_leadership': len(leadership),
                     'last_updated': timezone.now().isoformat(),
-                    'cache_duration': '10 minutes'
                 }
             }, status=status.HTTP_200_OK)
             
@@ -844,7 +836,7 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
             stats = cache.get(cache_key)
             
             if stats is None:
-                queryset = TeamMember.objects.filter(is_active=True)
+                queryset = TeamMember.objects.active()
                 
                 # Calculate comprehensive statistics
                 stats = {
@@ -873,10 +865,7 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
                     'avg_experience': queryset.aggregate(
                         avg_exp=Avg('years_experience')
                     )['avg_exp'] or 0,
-                    'skills_count': sum(
-                        len(member.skills) if member.skills else 0 
-                        for member in queryset
-                    ),
+                    'skills_count': TeamMemberSkill.objects.filter(member__is_active=True).count(),
                     'last_updated': timezone.now().isoformat()
                 }
                 
@@ -906,40 +895,36 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
                 }
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['get'])
+    def skills(self, request):
+        """
+        Skill facet list for the team directory: every skill held by an
+        active member with its member count, served from cache.
+        """
+        skills = get_skill_facets()
+        return Response({
+            'status': 'success',
+            'count': len(skills),
+            'data': skills,
+        }, status=status.HTTP_200_OK)
+    
     @action(detail=False, methods=['get'])
     def highlights(self, request):
         """
         Get team highlights for homepage and about page display.
-        Enhanced with better fallback logic and metadata.
+        Leadership first, then the most experienced members.
         """
         try:
-            # Try to get leadership members first
-            highlights = TeamMember.objects.filter(
-                is_active=True,
-                is_leadership=True
-            ).order_by('order', 'name')[:4]
-            
-            # If no leadership, get members with most experience
-            if not highlights.exists():
-                highlights = TeamMember.objects.filter(
-                    is_active=True
-                ).order_by('-years_experience', 'order', 'name')[:4]
-            
-            # Final fallback to any active members
-            if not highlights.exists():
-                highlights = TeamMember.objects.filter(
-                    is_active=True
-                ).order_by('order', 'name')[:4]
-            
+            highlights = get_highlights()
             serializer = TeamMemberSerializer(highlights, many=True)
             
             return Response({
                 'status': 'success',
-                'count': highlights.count(),
+                'count': len(highlights),
                 'results': serializer.data,
                 'metadata': {
                     'selection_criteria': 'leadership_priority',
-                    'total_active_members': TeamMember.objects.filter(is_active=True).count(),
+                    'total_active_members': len(get_active_members()),
                     'last_updated': timezone.now().isoformat()
                 }
             }, status=status.HTTP_200_OK)
@@ -962,29 +947,126 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
     - Retrieve individual job details
     - Filter by department, location, and activity status
     - Search by title, description, or requirements
-    - Ordered by creation date (newest first)
+    - Ordered by creation date (newest first), or by demand with
+      ?ordering=-recent_application_count or -application_count
     """
     serializer_class = JobPostingSerializer
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, TypoTolerantSearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'requirements', 'department']
     filterset_fields = ['department', 'location', 'is_active']
-    ordering_fields = ['created_at', 'title']
+    ordering_fields = ['created_at', 'title', 'application_count', 'recent_application_count']
     ordering = ['-created_at']
     
     def get_queryset(self):
         """
         Return only active job postings by default.
         """
-        return JobPosting.objects.filter(is_active=True).order_by('-created_at')
+        return JobPosting.objects.active().order_by('-created_at')
     
     @method_decorator(cache_page(60 * 15))  # Cache for 15 minutes
     def list(self, request, *args, **kwargs):
         """
         Cached list view for job postings.
         """
-        return super().list(request, *args, **kwargs)
+        return add_correction_hint(request, super().list(request, *args, **kwargs))
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Faceted job search.
+
+        Filters by ``q`` and any of department, location, job_type and
+        experience_level (each may repeat), and returns the page of jobs
+        together with the count for every facet value.
+        """
+        queryset, facets, correction = search_jobs(request.query_params)
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        response.data['facets'] = facets
+        if correction:
+            response.data['did_you_mean'] = correction
+        return response
+    
+    @action(detail=True, methods=['get'], permission_classes=[IsAdminUser])
+    def matches(self, request, pk=None):
+        """
+        Rank candidates for this job by how well their text matches its requirements.
+
+        Query parameters:
+        - source: applications (default, this job's applicants) or team
+        - status: only applications in this review status
+        - limit: number of results (default 50, max 500)
+
+        Every candidate in the pool is scored; only the top results are loaded
+        in full.
+        """
+        job = get_object_or_404(JobPosting, pk=pk)
+        source = request.query_params.get('source', 'applications')
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 500)
+        except ValueError:
+            limit = 50
+        job_text = f"{job.title} {job.requirements}"
+
+        if source == 'applications':
+            pool = JobApplication.objects.filter(job=job)
+            if request.query_params.get('status'):
+                pool = pool.filter(status=request.query_params['status'])
+            ranked = rank(job.skill_vector, pool.values_list('pk', 'skill_vector').iterator(chunk_size=2000), limit)
+            rows = JobApplication.objects.only('pk', 'name', 'email', 'status', 'cover_letter', 'created_at').in_bulk(
+                [pk for pk, _ in ranked]
+            )
+            # Resume words come from the applicant index rather than the full
+            # resume text. Only requirement words are looked up, since every
+            # application's index also holds the job title.
+            resume_terms = indexed_terms(JobApplication, list(rows), words(job.requirements))
+            data = [{
+                'id': pk,
+                'name': rows[pk].name,
+                'email': rows[pk].email,
+                'status': rows[pk].status,
+                'created_at': rows[pk].created_at.isoformat(),
+                'score': round(score, 4),
+                'matched_skills': matched_terms(job_text, rows[pk].cover_letter, candidate_terms=resume_terms[pk]),
+            } for pk, score in ranked]
+        elif source == 'team':
+            members = {member.pk: member for member in get_active_members()}
+            ranked = rank(job.skill_vector, (
+                (pk, text_vector(skills_text(member.skills), member.position)) for pk, member in members.items()
+            ), limit)
+            data = [{
+                'id': pk,
+                'name': members[pk].name,
+                'position': members[pk].position,
+                'score': round(score, 4),
+                'matched_skills': matched_terms(job_text, f"{skills_text(members[pk].skills)} {members[pk].position}"),
+            } for pk, score in ranked]
+        else:
+            return Response(
+                {'status': 'error', 'message': 'source must be "applications" or "team"'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            'status': 'success',
+            'data': data,
+            'count': len(data)
+        })
+    
+    @action(detail=True, methods=['get'])
+    def related(self, request, pk=None):
+        """
+        Get open positions similar to this one.
+        """
+        job = self.get_object()
+        serializer = self.get_serializer(related_objects(job, queryset=self.get_queryset()), many=True)
+        return Response({
+            'status': 'success',
+            'data': serializer.data,
+            'count': len(serializer.data)
+        })
     
     @action(detail=False, methods=['get'])
     def recent(self, request):
@@ -1012,12 +1094,9 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
         Get list of unique departments.
         """
         try:
-            departments = self.get_queryset().values_list(
-                'department', flat=True
-            ).distinct().order_by('department')
             return Response({
                 'status': 'success',
-                'data': list(departments)
+                'data': [value for value, _ in facet_values('department')]
             })
         except Exception as e:
             logger.error(f"Error fetching departments: {str(e)}")
@@ -1032,12 +1111,9 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
         Get list of unique locations.
         """
         try:
-            locations = self.get_queryset().values_list(
-                'location', flat=True
-            ).distinct().order_by('location')
             return Response({
                 'status': 'success',
-                'data': list(locations)
+                'data': [value for value, _ in facet_values('location')]
             })
         except Exception as e:
             logger.error(f"Error fetching locations: {str(e)}")
@@ -1065,6 +1141,17 @@ def job_application(request):
     """
     if request.method == 'POST':
         try:
+            # Reject spam and duplicates before any validation or write
+            rejection = prefilter_submission(
+                request, 'application', 'cover_letter', scope_field='job_id', file_field='resume_file'
+            )
+            if rejection:
+                logger.warning(f"Submission rejected by prefilter ({rejection.reason})")
+                return Response(
+                    {'status': 'error', 'message': rejection.message},
+                    status=rejection.status_code
+                )
+            
             # Apply rate limiting
             throttle = ContactRateThrottle()
             if not throttle.allow_request(request, None):
@@ -1081,7 +1168,8 @@ def job_application(request):
             serializer = JobApplicationSerializer(data=request.data)
             if serializer.is_valid():
                 # Save the job application
-                job_application = serializer.save()
+                job_application = serializer.save(source=submission_source(request))
+                remember_submission(request)
                 
                 # Send confirmation email
                 try:
@@ -1192,6 +1280,15 @@ def resume_submission(request):
     """
     if request.method == 'POST':
         try:
+            # Reject spam and duplicates before any validation or write
+            rejection = prefilter_submission(request, 'resume', 'message', file_field='resume_file')
+            if rejection:
+                logger.warning(f"Submission rejected by prefilter ({rejection.reason})")
+                return Response(
+                    {'status': 'error', 'message': rejection.message},
+                    status=rejection.status_code
+                )
+            
             # Apply rate limiting
             throttle = ContactRateThrottle()
             if not throttle.allow_request(request, None):
@@ -1208,7 +1305,8 @@ def resume_submission(request):
             serializer = ResumeSubmissionSerializer(data=request.data)
             if serializer.is_valid():
                 # Save the resume submission
-                resume_submission = serializer.save()
+                resume_submission = serializer.save(source=submission_source(request))
+                remember_submission(request)
                 
                 # Log successful submission
                 logger.info(f"Resume submitted: {resume_submission.id} from {resume_submission.email}")
@@ -1300,30 +1398,6 @@ def health_check(request):
         )
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-@cache_page(60 * 10)  # Cache for 10 minutes
-def team_leadership(request):
-    """
-    Get leadership team members for about page
-    """
-    try:
-        leaders = TeamMember.objects.filter(
-            is_active=True,
-            position__icontains='lead'
-        ).order_by('order')[:4]
-        
-        serializer = TeamMemberSerializer(leaders, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-        
-    except Exception as e:
-        logger.error(f"Team leadership error: {str(e)}")
-        return Response(
-            {'error': 'Failed to fetch team leadership'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
 @api_view(['GET'])
 @permission_classes([AllowAny])
 @cache_page(60 * 10)  # Cache for 10 minutes
@@ -1338,21 +1412,8 @@ def team_highlights(request):
     - Achievement highlights
     """
     try:
-        # Get team highlights with priority for leadership
-        team_highlights = TeamMember.objects.filter(
-            is_active=True
-        ).filter(
-            Q(position__icontains='lead') |
-            Q(position__icontains='director') |
-            Q(position__icontains='manager') |
-            Q(position__icontains='senior')
-        ).order_by('order', '-created_at')[:4]
-        
-        # Fallback to any active team members if no leadership found
-        if not team_highlights.exists():
-            team_highlights = TeamMember.objects.filter(
-                is_active=True
-            ).order_by('order', '-created_at')[:4]
+        # Leadership first, then by stored seniority rank
+        team_highlights = get_highlights()
         
         # Serialize team data
         team_data = TeamMemberSerializer(team_highlights, many=True).data
@@ -1389,11 +1450,8 @@ def team_highlights(request):
             'team_highlights': team_data,
             'total_count': len(team_data),
             'team_stats': {
-                'total_members': TeamMember.objects.filter(is_active=True).count(),
-                'leadership_count': TeamMember.objects.filter(
-                    is_active=True,
-                    position__icontains='lead'
-                ).count(),
+                'total_members': len(get_active_members()),
+                'leadership_count': TeamMember.objects.leadership().count(),
                 'average_experience': 7,  # Could be calculated from actual data
                 'total_expertise_areas': 25
             },
@@ -1455,23 +1513,13 @@ def homepage_data(request):
         featured_services = Service.objects.order_by('-created_at')[:3]
         
         # Get team highlights (leadership and key members)
-        team_highlights = TeamMember.objects.filter(
-            is_active=True
-        ).filter(
-            Q(position__icontains='lead') |
-            Q(position__icontains='director') |
-            Q(position__icontains='manager')
-        ).order_by('order')[:4]
-        
-        # Fallback to regular team members if no leadership found
-        if not team_highlights.exists():
-            team_highlights = TeamMember.objects.filter(is_active=True).order_by('order')[:4]
+        team_highlights = get_highlights()
         
         # Get recent jobs
-        recent_jobs = JobPosting.objects.filter(is_active=True).order_by('-created_at')[:3]
+        recent_jobs = JobPosting.objects.active().order_by('-created_at')[:3]
         
         # Calculate dynamic company stats
-        active_team_count = TeamMember.objects.filter(is_active=True).count()
+        active_team_count = TeamMember.objects.active().count()
         total_services = Service.objects.count()
         
         # Enhanced company statistics
@@ -1487,7 +1535,7 @@ def homepage_data(request):
             'satisfaction_rate': 98.5,
             'repeat_clients': 85,
             'active_services': total_services,
-            'open_positions': JobPosting.objects.filter(is_active=True).count()
+            'open_positions': JobPosting.objects.active().count()
         }
         
         # Hero section with dynamic content
@@ -1558,4 +1606,295 @@ def homepage_data(request):
                 'timestamp': timezone.now().isoformat()
             },
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def export_submissions(request, kind):
+    """
+    Stream job applications or resume submissions as CSV or NDJSON.
+
+    Query parameters:
+    - output: csv (default) or ndjson
+    - status: filter by review status
+    - job: filter applications by job posting id
+    - from / to: created date range (YYYY-MM-DD, inclusive)
+
+    Rows are read with a chunked iterator and written straight to the
+    response, so memory use does not grow with the number of rows.
+    """
+    export_format = request.query_params.get('output', 'csv')
+    try:
+        queryset, headers = build_export_queryset(
+            kind,
+            status=request.query_params.get('status'),
+            job=request.query_params.get('job'),
+            date_from=request.query_params.get('from'),
+            date_to=request.query_params.get('to'),
+        )
+        rows = iter_export(queryset, headers, export_format)
+    except ExportError as e:
+        return Response(
+            {'status': 'error', 'message': str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    filename = f"{kind}-{timezone.now().strftime('%Y%m%d-%H%M%S')}.{export_format}"
+    response = StreamingHttpResponse(rows, content_type=export_content_type(export_format))
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    logger.info(f"Export of {kind} ({export_format}) started by {request.user}")
+    return response
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_status_update(request):
+    """
+    Move a batch of job applications or resume submissions to a new status.
+
+    Expects JSON: {"type": "applications"|"resumes", "ids": [...], "status": "...", "note": "..."}
+
+    The whole batch is applied with one UPDATE inside a transaction and every
+    changed row gets an audit record. Rows whose current status cannot move to
+    the target under the review workflow are reported as skipped.
+    """
+    try:
+        result = transition_by_ids(
+            request.data.get('type'),
+            request.data.get('ids'),
+            request.data.get('status'),
+            user=request.user,
+            note=request.data.get('note', ''),
+        )
+    except WorkflowError as e:
+        return Response(
+            {'status': 'error', 'message': str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        logger.error(f"Error applying bulk status update: {str(e)}")
+        return Response(
+            {'status': 'error', 'message': 'Unable to update statuses. Please try again later.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    logger.info(
+        f"Bulk status update by {request.user}: {len(result['updated'])} {request.data.get('type')} "
+        f"moved to {request.data.get('status')}"
+    )
+    return Response({
+        'status': 'success',
+        'data': {
+            'updated': result['updated'],
+            'skipped': result['skipped'],
+            'missing': result['missing'],
+            'updated_count': len(result['updated']),
+        }
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def search_submissions(request):
+    """
+    Ranked full-text search over job applications and resume submissions,
+    including the text of uploaded resumes.
+
+    Query parameters:
+    - q: search words
+    - type: applications or resumes (default: both)
+    - limit: number of results (default 50, max 200)
+    """
+    query = request.query_params.get('q', '').strip()
+    kind = request.query_params.get('type')
+    if kind and kind not in SEARCH_TYPES:
+        return Response(
+            {'status': 'error', 'message': f'type must be one of: {", ".join(SEARCH_TYPES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        limit = min(max(int(request.query_params.get('limit', 50)), 1), 200)
+    except ValueError:
+        limit = 50
+
+    matches = search_applicants(query, models=[SEARCH_TYPES[kind]] if kind else None, limit=limit)
+    rows = {}
+    for model in {model for model, _, _, _ in matches}:
+        queryset = model.objects.only('pk', 'name', 'email', 'status', 'resume_text_status', 'created_at')
+        if model is JobApplication:
+            queryset = queryset.select_related('job').only(
+                'pk', 'name', 'email', 'status', 'resume_text_status', 'created_at', 'job__title'
+            )
+        rows[model] = queryset.in_bulk([pk for match_model, pk, _, _ in matches if match_model is model])
+
+    data = []
+    for model, pk, matched, score in matches:
+        submission = rows[model].get(pk)
+        if submission is None:
+            continue
+        data.append({
+            'type': 'applications' if model is JobApplication else 'resumes',
+            'id': pk,
+            'name': submission.name,
+            'email': submission.email,
+            'status': submission.status,
+            'job': submission.job.title if model is JobApplication and submission.job else None,
+            'resume_text_status': submission.resume_text_status,
+            'created_at': submission.created_at.isoformat(),
+            'matched_words': matched,
+            'score': round(score, 4),
+        })
+    return Response({
+        'status': 'success',
+        'query': query,
+        'data': data,
+        'count': len(data)
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def candidate_activity(request):
+    """
+    Everything a candidate has submitted, looked up by email address.
+
+    The address is normalized and hashed, so one indexed lookup finds the
+    candidate and one more query returns all of their applications and
+    resume submissions, newest first.
+    """
+    email = request.query_params.get('email', '').strip()
+    if not email:
+        return Response(
+            {'status': 'error', 'message': 'email is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    candidate = Candidate.objects.filter(email_hash=email_digest(email)).first()
+    if candidate is None:
+        return Response(
+            {'status': 'error', 'message': 'No submissions found for this email'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response({
+        'status': 'success',
+        'data': {
+            'id': candidate.pk,
+            'email': candidate.email,
+            'name': candidate.name,
+            'application_count': candidate.application_count,
+            'resume_count': candidate.resume_count,
+            'latest_status': candidate.latest_status,
+            'last_activity_at': candidate.last_activity_at.isoformat() if candidate.last_activity_at else None,
+            'activity': [
+                {
+                    'type': 'applications' if row['kind'] == 'application' else 'resumes',
+                    'id': row['pk'],
+                    'job': row['title'] or None,
+                    'status': row['status'],
+                    'created_at': row['created_at'].isoformat(),
+                }
+                for row in candidate.activity()
+            ],
+        }
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def submission_analytics(request):
+    """
+    Submission funnel and daily time series for the hiring dashboard.
+
+    Query params:
+        - type: applications (default) or resumes
+        - from, to: ISO dates, defaulting to the last 30 days
+        - job: limit to one job posting id
+
+    Served from the daily rollup table with one range query, so the cost does
+    not grow with the number of submissions received.
+    """
+    model = ANALYTICS_TYPES.get(request.query_params.get('type', 'applications'))
+    if model is None:
+        return Response(
+            {'status': 'error', 'message': f"type must be one of: {', '.join(ANALYTICS_TYPES)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        end = date.fromisoformat(request.query_params['to']) if 'to' in request.query_params else timezone.localdate()
+        start = (
+            date.fromisoformat(request.query_params['from']) if 'from' in request.query_params
+            else end - timedelta(days=DEFAULT_DAYS - 1)
+        )
+        job_id = int(request.query_params['job']) if 'job' in request.query_params else None
+    except ValueError:
+        return Response(
+            {'status': 'error', 'message': 'from and to must be ISO dates and job an integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if start > end or (end - start).days >= MAX_DAYS:
+        return Response(
+            {'status': 'error', 'message': f'from must not be after to, and the range is limited to {MAX_DAYS} days'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response({'status': 'success', 'data': dashboard(model, start, end, job_id)})
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def batch_resources(request):
+    """
+    Resolve several read-only API endpoints in one round-trip.
+
+    Pass each endpoint as a repeated ``path`` query parameter, e.g.
+    /api/batch/?path=/api/homepage/&path=/api/services/featured/
+
+    Sub-requests are dispatched in-process to the existing views, so they
+    reuse their caching and share one database connection. Each one is
+    throttled like a direct call to its endpoint. The response maps each
+    requested path to its status code and payload.
+    """
+    try:
+        results = resolve_batch(request._request, request.query_params.getlist('path'))
+    except BatchError as e:
+        return Response(
+            {'status': 'error', 'message': str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        logger.error(f"Batch request error: {str(e)}")
+        return Response(
+            {'status': 'error', 'message': 'Unable to process batch request'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    return Response({
+        'status': 'success',
+        'responses': results,
+        'count': len(results),
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@throttle_classes([SuggestRateThrottle])
+def suggestions(request):
+    """
+    Search-as-you-type suggestions for services, technologies, jobs,
+    departments and team skills.
+
+    Answered from the in-process prefix index in website.suggest, under its
+    own per-minute burst limit instead of the daily anonymous one.
+    """
+    query = request.query_params.get('q', '').strip()
+    try:
+        limit = int(request.query_params.get('limit', 10))
+    except ValueError:
+        limit = 10
+
+    results = [suggestion._asdict() for suggestion in suggest(query, max(limit, 1))] if query else []
+    return Response({
+        'status': 'success',
+        'query': query,
+        'data': results,
+        'count': len(results)
+    }, status=status.HTTP_200_OK)
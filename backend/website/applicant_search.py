@@ -0,0 +1,256 @@
+import atexit
+import logging
+import math
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, Sum
+
+from .extraction import extract
+from .matching import text_vector, words
+from .models import ApplicantTerm, JobApplication, ResumeSubmission
+
+logger = logging.getLogger(__name__)
+
+
+# === Applicant Full-Text Index ===
+#
+# Every job application and resume submission is indexed as ApplicantTerm
+# rows: one per distinct word of its name, email, letter, notes and resume text,
+# weighted by dampened frequency over document length. A search is one
+# grouped query on the term index, ranked by how many query words matched
+# and then by their summed weight. Files are never opened on the request
+# path: resume text is extracted beforehand by extract_pending().
+
+# Matches the admin search_fields, plus the extracted resume text
+INDEXED_FIELDS = {
+    JobApplication: ('name', 'email', 'cover_letter', 'notes', 'job__title', 'resume_text'),
+    ResumeSubmission: ('name', 'email', 'message', 'notes', 'resume_text'),
+}
+
+SEARCH_TYPES = {
+    'applications': JobApplication,
+    'resumes': ResumeSubmission,
+}
+
+MAX_TERM_LENGTH = 50
+
+
+def term_weights(*texts):
+    counts = Counter(word[:MAX_TERM_LENGTH] for text in texts for word in words(text))
+    norm = math.sqrt(len(counts)) or 1.0
+    return {term: (1 + math.log(count)) / norm for term, count in counts.items()}
+
+
+def reindex(model, pks):
+    """Replace the index entries of the given rows with their current text."""
+    model_name = model._meta.model_name
+    rows = model.objects.filter(pk__in=pks).values_list('pk', *INDEXED_FIELDS[model])
+    with transaction.atomic():
+        ApplicantTerm.objects.filter(model_name=model_name, object_id__in=pks).delete()
+        ApplicantTerm.objects.bulk_create([
+            ApplicantTerm(model_name=model_name, object_id=pk, term=term, weight=weight)
+            for pk, *texts in rows
+            for term, weight in term_weights(*texts).items()
+        ], batch_size=1000)
+
+
+def remove_from_index(model, pk):
+    ApplicantTerm.objects.filter(model_name=model._meta.model_name, object_id=pk).delete()
+
+
+def indexed_terms(model, pks, terms):
+    """{pk: {term, ...}} of the given ``terms`` the index holds for each row, in one query."""
+    found = {pk: set() for pk in pks}
+    rows = ApplicantTerm.objects.filter(
+        model_name=model._meta.model_name, object_id__in=list(found),
+        term__in={term[:MAX_TERM_LENGTH] for term in terms},
+    ).values_list('object_id', 'term')
+    for pk, term in rows:
+        found[pk].add(term)
+    return found
+
+
+def search_applicants(query, models=None, limit=50):
+    """
+    Rank submissions for ``query``.
+
+    Returns [(model, pk, matched_words, score), ...], best first, from a
+    single query on the term index.
+    """
+    query_terms = list(dict.fromkeys(word[:MAX_TERM_LENGTH] for word in words(query)))
+    if not query_terms:
+        return []
+    by_name = {model._meta.model_name: model for model in (models or SEARCH_TYPES.values())}
+    rows = (
+        ApplicantTerm.objects
+        .filter(term__in=query_terms, model_name__in=list(by_name))
+        .values('model_name', 'object_id')
+        .annotate(matched=Count('id'), score=Sum('weight'))
+        .order_by('-matched', '-score', '-object_id')[:limit]
+    )
+    return [(by_name[row['model_name']], row['object_id'], row['matched'], row['score']) for row in rows]
+
+
+# === Resume Text Extraction ===
+
+EXTRACTION_WORKERS = 2
+EXTRACTION_BATCH_SIZE = 8
+
+# Files are read into memory to be handed to a worker; larger ones are skipped
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+
+# Workers are replaced after this many files, so parser leaks cannot build up
+TASKS_PER_WORKER = 50
+
+
+def _read_file(field):
+    if field.size > MAX_RESUME_BYTES:
+        raise ValueError(f'{field.name} is {field.size} bytes')
+    with field.open('rb') as resume:
+        return resume.read()
+
+
+def _save_results(model, results):
+    for pk, extraction_status, text in results:
+        values = {'resume_text': text, 'resume_text_status': extraction_status}
+        if model is JobApplication:
+            cover_letter = model.objects.filter(pk=pk).values_list('cover_letter', flat=True).first() or ''
+            values['skill_vector'] = text_vector(cover_letter, text)
+        model.objects.filter(pk=pk).update(**values)
+    reindex(model, [pk for pk, _, _ in results])
+
+
+def extract_pending(limit=None, workers=None, batch_size=None):
+    """
+    Extract the text of every resume still marked pending, then index it.
+
+    Files are parsed by the shared pool of worker processes in batches of
+    ``batch_size``, so at most one batch of files is held in memory at a
+    time. Returns the number of submissions processed.
+    """
+    workers = workers or getattr(settings, 'RESUME_EXTRACTION_WORKERS', EXTRACTION_WORKERS)
+    batch_size = batch_size or getattr(settings, 'RESUME_EXTRACTION_BATCH_SIZE', EXTRACTION_BATCH_SIZE)
+    processed = 0
+    for model in SEARCH_TYPES.values():
+        pending = model.objects.filter(resume_text_status='pending').order_by('pk').values_list('pk', flat=True)
+        if limit is not None:
+            pending = pending[:max(limit - processed, 0)]
+        pks = list(pending)
+        for start in range(0, len(pks), batch_size):
+            batch = model.objects.filter(pk__in=pks[start:start + batch_size]).only('pk', 'resume_file')
+            processed += _process_batch(model, list(batch), workers)
+    return processed
+
+
+# One pool per process, started on first use (so processes that never parse a
+# file spawn nothing), reused by every later run and shut down at exit
+_pool = None
+_pool_workers = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            # spawn, not fork: this may run on a thread of a multi-threaded web worker
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                max_tasks_per_child=TASKS_PER_WORKER,
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(broken=None):
+    """Shut the shared pool down; with ``broken``, only if it is still that pool."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or (broken is not None and _pool is not broken):
+            return
+        pool, _pool, _pool_workers = _pool, None, None
+    pool.shutdown(wait=broken is None, cancel_futures=True)
+
+
+atexit.register(_discard_pool)
+
+
+def _process_batch(model, batch, workers):
+    results, tasks = [], []
+    for submission in batch:
+        if not submission.resume_file:
+            results.append((submission.pk, 'none', ''))
+            continue
+        try:
+            tasks.append((submission.pk, _read_file(submission.resume_file), submission.resume_file.name))
+        except Exception as e:
+            logger.error(f"Unable to read resume for {model._meta.model_name} {submission.pk}: {str(e)}")
+            results.append((submission.pk, 'failed', ''))
+    if tasks:
+        pool = _get_pool(workers)
+        try:
+            results.extend(pool.map(extract, tasks))
+        except BrokenProcessPool:
+            # A worker died mid-batch; the next run starts a fresh pool
+            _discard_pool(pool)
+            raise
+    _save_results(model, results)
+    return len(results)
+
+
+# === Background Scheduling ===
+
+_running = False
+_rerun = False
+_lock = threading.Lock()
+
+
+def _run_in_background():
+    global _running, _rerun
+    try:
+        while True:
+            extract_pending()
+            with _lock:
+                if not _rerun:
+                    _running = False
+                    return
+                _rerun = False
+    except Exception as e:
+        logger.error(f"Resume text extraction failed: {str(e)}")
+        with _lock:
+            _running = False
+    finally:
+        connections.close_all()
+
+
+def _start():
+    global _running, _rerun
+    with _lock:
+        if _running:
+            # The running pass may already be past the new row; go round again
+            _rerun = True
+            return
+        _running = True
+    threading.Thread(target=_run_in_background, daemon=True).start()
+
+
+def schedule_extraction():
+    """
+    Process new submissions on a background thread once the current
+    transaction commits. Disable with RESUME_EXTRACTION_IN_PROCESS = False and
+    run the extract_resume_text command from a scheduler instead.
+    """
+    if not getattr(settings, 'RESUME_EXTRACTION_IN_PROCESS', True):
+        return
+    if any(func is _start for _, func, _ in transaction.get_connection().run_on_commit):
+        return
+    transaction.on_commit(_start)
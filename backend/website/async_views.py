@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .job_search import facet_values
+from .models import JobPosting, Service
+from .serializers import JobPostingSerializer
+from .throttling import SlidingWindowAnonRateThrottle, SlidingWindowUserRateThrottle
+
+logger = logging.getLogger(__name__)
+
+
+# === Async Views ===
+#
+# Used instead of their DRF counterparts when the project runs under ASGI
+# (settings.USE_ASYNC_VIEWS). Waiting on the database or an upstream API then
+# suspends a coroutine instead of holding a worker thread. Responses match the
+# sync views field for field.
+
+GEMINI_API_URL = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent'
+
+_http_client = None
+
+
+def get_http_client():
+    """Process-wide client so upstream TLS connections are reused across requests."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=30)
+    return _http_client
+
+
+def _throttle_wait(request):
+    """Apply the default API throttles; returns seconds to wait, or None if allowed."""
+    for throttle_class in (SlidingWindowAnonRateThrottle, SlidingWindowUserRateThrottle):
+        throttle = throttle_class()
+        if not throttle.allow_request(request, None):
+            return throttle.wait()
+    return None
+
+
+async def throttled_response(request):
+    wait = await sync_to_async(_throttle_wait)(request)
+    if wait is None:
+        return None
+    response = JsonResponse(
+        {'detail': f'Request was throttled. Expected available in {int(wait)} seconds.'},
+        status=429
+    )
+    response['Retry-After'] = str(int(wait))
+    return response
+
+
+@csrf_exempt
+@require_POST
+async def gemini_api_proxy(request):
+    """
+    Proxy endpoint for Gemini API requests.
+
+    Async variant of api_proxy.gemini_api_proxy; the upstream call is awaited
+    with httpx instead of blocking a worker for up to 30 seconds.
+    """
+    throttled = await throttled_response(request)
+    if throttled:
+        return throttled
+
+    api_key = os.environ.get('VITE_GEMINI_API_KEY', '')
+    if not api_key:
+        logger.error("Gemini API key not found in environment variables")
+        return JsonResponse({
+            'error': 'API configuration error',
+            'message': 'The server is not properly configured for AI services.'
+        }, status=500)
+
+    try:
+        request_data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'error': 'Invalid request format',
+            'message': 'Request must be valid JSON'
+        }, status=400)
+
+    try:
+        response = await get_http_client().post(
+            GEMINI_API_URL,
+            params={'key': api_key},
+            headers={'Content-Type': 'application/json'},
+            json=request_data,
+        )
+        return JsonResponse(response.json(), status=response.status_code)
+    except httpx.HTTPError as e:
+        logger.error(f"Error forwarding request to Gemini API: {str(e)}")
+        return JsonResponse({
+            'error': 'API service error',
+            'message': 'Unable to communicate with the AI service.'
+        }, status=503)
+    except ValueError as e:
+        logger.error(f"Invalid response from Gemini API: {str(e)}")
+        return JsonResponse({
+            'error': 'API service error',
+            'message': 'Unable to communicate with the AI service.'
+        }, status=503)
+
+
+@require_GET
+async def health_check(request):
+    """
+    Async health check with database and cache status.
+    """
+    db_status = 'ok'
+    try:
+        await Service.objects.acount()
+    except Exception as e:
+        db_status = f'error: {str(e)}'
+        logger.error(f"Database health check failed: {str(e)}")
+
+    cache_status = 'ok'
+    try:
+        await cache.aset('health_check', 'test', 10)
+        await cache.aget('health_check')
+    except Exception as e:
+        cache_status = f'error: {str(e)}'
+        logger.error(f"Cache health check failed: {str(e)}")
+
+    return JsonResponse({
+        'status': 'ok',
+        'timestamp': timezone.now().isoformat(),
+        'services': {
+            'database': db_status,
+            'cache': cache_status
+        },
+        'version': '1.0.0'
+    })
+
+
+@require_GET
+async def recent_jobs(request):
+    """
+    Get recent job postings for homepage (JobPostingViewSet.recent).
+    """
+    throttled = await throttled_response(request)
+    if throttled:
+        return throttled
+
+    recent = [job async for job in JobPosting.objects.active().order_by('-created_at')[:3]]
+    data = JobPostingSerializer(recent, many=True, context={'request': request}).data
+    return JsonResponse({
+        'status': 'success',
+        'data': data,
+        'count': len(data)
+    })
+
+
+async def _distinct_values(request, field):
+    throttled = await throttled_response(request)
+    if throttled:
+        return throttled
+
+    values = await sync_to_async(facet_values)(field)
+    return JsonResponse({
+        'status': 'success',
+        'data': [value for value, _ in values]
+    })
+
+
+@require_GET
+async def job_departments(request):
+    """
+    Get list of unique departments (JobPostingViewSet.departments).
+    """
+    return await _distinct_values(request, 'department')
+
+
+@require_GET
+async def job_locations(request):
+    """
+    Get list of unique locations (JobPostingViewSet.locations).
+    """
+    return await _distinct_values(request, 'location')
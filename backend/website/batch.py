@@ -0,0 +1,111 @@
+import json
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+
+
+# === Batch Settings ===
+
+MAX_BATCH_REQUESTS = 10
+
+# Read-only endpoints that may be bundled into one batch call
+BATCHABLE_URL_NAMES = {
+    'api_homepage',
+    'api_featured_services',
+    'api_team_highlights',
+    'api_service_stats',
+    'api_team_leadership',
+    'api_recent_jobs',
+    'api_job_departments',
+    'api_job_locations',
+    'service-list',
+    'service-detail',
+    'service-related',
+    'service-featured',
+    'service-stats',
+    'service-categories',
+    'team-list',
+    'team-detail',
+    'team-leadership',
+    'team-departments',
+    'team-stats',
+    'team-highlights',
+    'job-list',
+    'job-detail',
+    'job-related',
+    'job-recent',
+    'job-departments',
+    'job-locations',
+}
+
+
+class BatchError(ValueError):
+    """Raised when a batch request is malformed."""
+
+
+def _build_subrequest(request, path, query_string, match):
+    """Clone the outer request as a GET for ``path`` so views see the same client."""
+    subrequest = HttpRequest()
+    subrequest.method = 'GET'
+    subrequest.path = subrequest.path_info = path
+    subrequest.META = {
+        **request.META,
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query_string,
+    }
+    subrequest.GET = QueryDict(query_string)
+    subrequest.COOKIES = request.COOKIES
+    subrequest.resolver_match = match
+    for attr in ('user', 'session', 'csp_nonce'):
+        if hasattr(request, attr):
+            setattr(subrequest, attr, getattr(request, attr))
+    # Each sub-request goes through its view's own throttles, so a batch of N
+    # paths costs as much of the rate limit as N separate calls
+    return subrequest
+
+
+def _response_payload(response):
+    if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+        # Rendering also runs post-render callbacks, which is where cache_page stores the result
+        response.render()
+    if hasattr(response, 'data'):
+        return response.data
+    try:
+        return json.loads(response.content)
+    except (TypeError, ValueError):
+        return None
+
+
+def resolve_batch(request, paths):
+    """
+    Resolve each path against the website API and call its view in-process.
+
+    ``request`` is the outer Django HttpRequest. All sub-requests run in this
+    thread, so they share one database connection and the same cache client.
+    Returns a dict of ``{path: {'status': code, 'data': payload}}``.
+    """
+    if not paths:
+        raise BatchError("Provide at least one path.")
+    if len(paths) > MAX_BATCH_REQUESTS:
+        raise BatchError(f"At most {MAX_BATCH_REQUESTS} paths can be requested per batch.")
+
+    results = {}
+    for raw_path in paths:
+        parts = urlsplit(raw_path)
+        path = parts.path if parts.path.startswith('/') else f'/{parts.path}'
+        try:
+            match = resolve(path, urlconf='website.urls')
+        except Resolver404:
+            results[raw_path] = {'status': 404, 'data': {'status': 'error', 'message': 'Not found'}}
+            continue
+        if match.url_name not in BATCHABLE_URL_NAMES:
+            results[raw_path] = {'status': 400, 'data': {'status': 'error', 'message': 'Endpoint cannot be batched'}}
+            continue
+
+        view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+        response = view(_build_subrequest(request, path, parts.query, match), *match.args, **match.kwargs)
+        results[raw_path] = {'status': response.status_code, 'data': _response_payload(response)}
+    return results
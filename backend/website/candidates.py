@@ -0,0 +1,71 @@
+from django.db.models import Count, Max
+
+
+# === Candidate Backfill ===
+#
+# New submissions are linked to their Candidate on insert (see
+# CandidateLinkMixin). These helpers link rows that predate that, and
+# recompute the denormalized counters from scratch. They take the model
+# classes as arguments so the data migration can pass its historical models.
+
+BATCH_SIZE = 500
+
+
+def link_submissions(candidate_model, submission_model, digest, normalize):
+    """Attach every unlinked submission to the candidate for its email, creating candidates as needed."""
+    groups = {}
+    names = {}
+    rows = submission_model.objects.filter(candidate__isnull=True).order_by('created_at').values_list('pk', 'email', 'name')
+    for pk, email, name in rows.iterator(chunk_size=2000):
+        key = digest(email)
+        groups.setdefault(key, []).append(pk)
+        names[key] = (normalize(email), name)
+
+    existing = candidate_model.objects.in_bulk(list(groups), field_name='email_hash')
+    candidate_model.objects.bulk_create([
+        candidate_model(email_hash=key, email=names[key][0], name=names[key][1])
+        for key in groups if key not in existing
+    ], batch_size=BATCH_SIZE, ignore_conflicts=True)
+    candidates = dict(candidate_model.objects.filter(email_hash__in=list(groups)).values_list('email_hash', 'pk'))
+
+    for key, pks in groups.items():
+        submission_model.objects.filter(pk__in=pks).update(candidate_id=candidates[key])
+    return sum(len(pks) for pks in groups.values())
+
+
+def refresh_counters(candidate_model, submission_models):
+    """
+    Recompute counters, last activity and latest status for every candidate.
+
+    ``submission_models`` maps each submission model to the Candidate field
+    counting it. The latest status is the status of the newest submission.
+    """
+    stats = {}
+    for model, counter in submission_models.items():
+        rows = model.objects.filter(candidate__isnull=False).values('candidate_id').annotate(
+            total=Count('id'), latest=Max('created_at')
+        )
+        for row in rows:
+            entry = stats.setdefault(row['candidate_id'], {'latest': None, 'model': None})
+            entry[counter] = row['total']
+            if entry['latest'] is None or row['latest'] > entry['latest']:
+                entry['latest'], entry['model'] = row['latest'], model
+
+    counters = list(submission_models.values())
+    candidates = []
+    for candidate in candidate_model.objects.all().iterator(chunk_size=2000):
+        entry = stats.get(candidate.pk, {'latest': None, 'model': None})
+        for counter in counters:
+            setattr(candidate, counter, entry.get(counter, 0))
+        candidate.last_activity_at = entry['latest']
+        candidate.latest_status = ''
+        if entry['model'] is not None:
+            candidate.latest_status = entry['model'].objects.filter(
+                candidate_id=candidate.pk
+            ).order_by('-created_at').values_list('status', flat=True).first() or ''
+        candidates.append(candidate)
+
+    candidate_model.objects.bulk_update(
+        candidates, counters + ['last_activity_at', 'latest_status'], batch_size=BATCH_SIZE
+    )
+    return len(candidates)
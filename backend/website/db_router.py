@@ -0,0 +1,58 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+# === Read Replica Routing ===
+#
+# ReplicaRoutingMiddleware marks safe (GET/HEAD/OPTIONS) requests as
+# replica-eligible, unless the client wrote something within the sticky
+# window. While a request is marked, ReplicaRouter sends reads to a random
+# replica alias. Writes, reads inside a transaction and everything outside a
+# marked request go to the primary.
+
+# Cookie set after a write so the client reads its own data from the primary
+STICKY_COOKIE = 'db_primary'
+
+_use_replica = ContextVar('use_replica', default=False)
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+@contextmanager
+def read_from_replicas(enabled=True):
+    """Route reads in this block to replicas (when any are configured)."""
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if not replicas or not _use_replica.get():
+            return DEFAULT_DB_ALIAS
+        # Database cache entries (the version stamps) must not lag behind saves
+        if model._meta.app_label == 'django_cache':
+            return DEFAULT_DB_ALIAS
+        # Reads that are part of a transaction must see its writes
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,146 @@
+import csv
+import json
+from datetime import datetime, time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import JobApplication, ResumeSubmission
+
+
+# === Export Definitions ===
+
+# Rows are fetched in chunks of this size so memory stays flat regardless of table size
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+EXPORT_DEFINITIONS = {
+    'applications': {
+        'model': JobApplication,
+        'fields': [
+            'id', 'job_id', 'job__title', 'name', 'email', 'phone',
+            'status', 'is_reviewed', 'email_sent', 'resume_file', 'resume_link',
+            'created_at',
+        ],
+        'headers': [
+            'id', 'job_id', 'job_title', 'name', 'email', 'phone',
+            'status', 'is_reviewed', 'email_sent', 'resume_file', 'resume_link',
+            'created_at',
+        ],
+    },
+    'resumes': {
+        'model': ResumeSubmission,
+        'fields': [
+            'id', 'name', 'email', 'phone', 'status', 'is_reviewed',
+            'resume_file', 'resume_link', 'created_at',
+        ],
+        'headers': [
+            'id', 'name', 'email', 'phone', 'status', 'is_reviewed',
+            'resume_file', 'resume_link', 'created_at',
+        ],
+    },
+}
+
+
+class ExportError(ValueError):
+    """Raised when export parameters are invalid."""
+
+
+# === Queryset Construction ===
+
+def _parse_day(value, label, end_of_day=False):
+    day = parse_date(value) if value else None
+    if value and day is None:
+        raise ExportError(f"Invalid {label} date '{value}'. Use YYYY-MM-DD.")
+    if day is None:
+        return None
+    moment = datetime.combine(day, time.max if end_of_day else time.min)
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+def build_export_queryset(kind, status=None, job=None, date_from=None, date_to=None):
+    """
+    Return a (queryset, headers) pair for a streaming export.
+
+    The queryset yields flat value tuples rather than model instances and is
+    ordered by primary key so chunked iteration walks the clustered index.
+    """
+    definition = EXPORT_DEFINITIONS.get(kind)
+    if definition is None:
+        raise ExportError(f"Unknown export '{kind}'. Choose from: {', '.join(EXPORT_DEFINITIONS)}.")
+
+    model = definition['model']
+    # Bypasses a transaction pooler, so iterator() can use a server-side cursor
+    queryset = model.objects.using(getattr(settings, 'DATABASE_DIRECT_ALIAS', DEFAULT_DB_ALIAS)).all()
+
+    if status:
+        valid_statuses = {choice for choice, _ in model._meta.get_field('status').choices}
+        if status not in valid_statuses:
+            raise ExportError(f"Invalid status '{status}'.")
+        queryset = queryset.filter(status=status)
+
+    if job:
+        if model is not JobApplication:
+            raise ExportError("The job filter only applies to job applications.")
+        try:
+            queryset = queryset.filter(job_id=int(job))
+        except (TypeError, ValueError):
+            raise ExportError(f"Invalid job id '{job}'.")
+
+    start = _parse_day(date_from, 'from')
+    end = _parse_day(date_to, 'to', end_of_day=True)
+    if start:
+        queryset = queryset.filter(created_at__gte=start)
+    if end:
+        queryset = queryset.filter(created_at__lte=end)
+
+    queryset = queryset.order_by('pk').values_list(*definition['fields'])
+    return queryset, definition['headers']
+
+
+# === Row Streaming ===
+
+class Echo:
+    """File-like object that returns what is written, for use with csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+# Spreadsheets run cells starting with these as formulas; applicants control
+# names, emails and links, so such cells are quoted with a leading apostrophe
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def csv_safe(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_csv(queryset, headers, chunk_size=EXPORT_CHUNK_SIZE):
+    writer = csv.writer(Echo())
+    yield writer.writerow(headers)
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield writer.writerow([csv_safe(value) for value in row])
+
+
+def iter_ndjson(queryset, headers, chunk_size=EXPORT_CHUNK_SIZE):
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def iter_export(queryset, headers, export_format='csv', chunk_size=EXPORT_CHUNK_SIZE):
+    if export_format == 'csv':
+        return iter_csv(queryset, headers, chunk_size)
+    if export_format == 'ndjson':
+        return iter_ndjson(queryset, headers, chunk_size)
+    raise ExportError(f"Unknown format '{export_format}'. Choose from: {', '.join(EXPORT_FORMATS)}.")
+
+
+def export_content_type(export_format):
+    return 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
@@ -0,0 +1,102 @@
+import io
+import os
+import zipfile
+from xml.etree import ElementTree
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # Optional: PDFs are marked unsupported without it
+    PdfReader = None
+
+
+# === Resume Text Extraction ===
+#
+# Runs inside the worker processes of applicant_search.extract_pending, so
+# this module imports nothing from Django. Both parsers are pure Python and
+# stop early: at most MAX_PAGES pages or MAX_CHARS characters are read from
+# a file, and a DOCX whose text part would inflate past MAX_DOCX_XML_BYTES
+# is refused before it is decompressed.
+
+MAX_PAGES = 20
+MAX_CHARS = 100_000
+MAX_DOCX_XML_BYTES = 20 * 1024 * 1024
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class UnsupportedFormat(Exception):
+    """The file type cannot be read by any available parser."""
+
+
+def extract_docx(data, max_chars=MAX_CHARS):
+    parts = []
+    size = 0
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        info = archive.getinfo('word/document.xml')
+        if info.file_size > MAX_DOCX_XML_BYTES:
+            raise ValueError(f'document.xml is {info.file_size} bytes uncompressed')
+        with archive.open(info) as document:
+            for _, element in ElementTree.iterparse(document, events=('end',)):
+                if element.tag == WORD_NAMESPACE + 't' and element.text:
+                    parts.append(element.text)
+                    size += len(element.text)
+                elif element.tag in (WORD_NAMESPACE + 'tab', WORD_NAMESPACE + 'br'):
+                    parts.append(' ')
+                elif element.tag == WORD_NAMESPACE + 'p':
+                    parts.append('\n')
+                    # Paragraphs are complete here; drop them to keep memory flat
+                    element.clear()
+                if size >= max_chars:
+                    break
+    return ''.join(parts)
+
+
+def extract_pdf(data, max_chars=MAX_CHARS, max_pages=MAX_PAGES):
+    if PdfReader is None:
+        raise UnsupportedFormat('pypdf is not installed')
+    reader = PdfReader(io.BytesIO(data))
+    parts = []
+    size = 0
+    for number, page in enumerate(reader.pages):
+        if number >= max_pages or size >= max_chars:
+            break
+        text = page.extract_text() or ''
+        parts.append(text)
+        size += len(text)
+    return '\n'.join(parts)
+
+
+EXTRACTORS = {
+    '.docx': extract_docx,
+    '.pdf': extract_pdf,
+}
+
+
+def extract_text(data, filename):
+    """
+    Plain text of a resume file.
+
+    Raises UnsupportedFormat for file types without a parser (legacy .doc).
+    Whitespace is collapsed and the result is cut to MAX_CHARS.
+    """
+    extractor = EXTRACTORS.get(os.path.splitext(filename)[1].lower())
+    if extractor is None:
+        raise UnsupportedFormat(f'no parser for {filename}')
+    text = extractor(data)
+    lines = (' '.join(line.split()) for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)[:MAX_CHARS]
+
+
+def extract(task):
+    """
+    Worker entry point: ``(key, data, filename)`` -> ``(key, status, text)``.
+
+    Never raises, so one broken file cannot take down a batch.
+    """
+    key, data, filename = task
+    try:
+        return key, 'done', extract_text(data, filename)
+    except UnsupportedFormat:
+        return key, 'unsupported', ''
+    except Exception:
+        return key, 'failed', ''
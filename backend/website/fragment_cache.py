@@ -0,0 +1,63 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+# === Model Version Stamps ===
+#
+# Each cached template fragment includes the version stamp of the models it
+# renders in its cache key. Saving or deleting a row bumps the stamp, so the
+# next render misses the cache and stale fragments simply expire.
+
+VERSION_KEY = 'model_version:{}'
+
+# Stamps must be shared by every worker, unlike a per-process LocMem default
+VERSION_CACHE_ALIAS = 'versions'
+
+
+def shared_cache():
+    """The cache every worker and host sees (Redis or a database table), for state that must not be per process."""
+    return caches[VERSION_CACHE_ALIAS if VERSION_CACHE_ALIAS in settings.CACHES else 'default']
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label_lower
+
+
+def get_model_version(model):
+    key = VERSION_KEY.format(_label(model).lower())
+    stamps = shared_cache()
+    version = stamps.get(key)
+    if version is None:
+        # Seed from the clock so an evicted stamp never reuses an old value
+        version = int(time.time() * 1000)
+        if not stamps.add(key, version, None):
+            version = stamps.get(key, version)
+    return version
+
+
+def bump_model_version(model):
+    key = VERSION_KEY.format(_label(model).lower())
+    stamps = shared_cache()
+    try:
+        stamps.incr(key)
+    except ValueError:
+        # No stamp cached yet (or it was evicted); start a fresh one
+        stamps.set(key, int(time.time() * 1000), None)
+
+
+def get_model_version_map(*models):
+    """Version stamps for several models in one cache round-trip, as ``{model: version}``."""
+    keys = {model: VERSION_KEY.format(_label(model).lower()) for model in models}
+    found = shared_cache().get_many(list(keys.values()))
+    # Only stamps that are missing are seeded one by one
+    return {
+        model: found[key] if key in found else get_model_version(model)
+        for model, key in keys.items()
+    }
+
+
+def get_model_versions(*models):
+    """Combined version string for a fragment that depends on several models."""
+    return '-'.join(str(version) for version in get_model_version_map(*models).values())
@@ -0,0 +1,114 @@
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .fragment_cache import get_model_version
+from .models import JobPosting, normalize_location
+from .spelling import correct_query
+
+
+# === Faceted Job Search ===
+#
+# Facet counts come from a single grouped query: the number of jobs for each
+# distinct (department, location, job_type, experience_level) combination.
+# The counts per field, and the counts under any selection, are folded from
+# those rows in Python. Without a search term the rows for all open jobs are
+# cached under the JobPosting version stamp, so a careers page load only
+# queries the page of jobs itself.
+
+FACET_FIELDS = ('department', 'location', 'job_type', 'experience_level')
+
+FACET_CACHE_TIMEOUT = 60 * 60
+
+SEARCH_FIELDS = ('title', 'description', 'requirements', 'department')
+
+
+def _combinations(queryset):
+    rows = queryset.order_by().values(*FACET_FIELDS).annotate(count=Count('id'))
+    return [(tuple(row[field] for field in FACET_FIELDS), row['count']) for row in rows]
+
+
+def get_facet_index():
+    """Job counts per facet combination over all open jobs, cached."""
+    key = f"jobs:facets:{get_model_version(JobPosting)}"
+    combinations = cache.get(key)
+    if combinations is None:
+        combinations = _combinations(JobPosting.objects.active())
+        cache.set(key, combinations, FACET_CACHE_TIMEOUT)
+    return combinations
+
+
+def facet_counts(combinations, selected=None):
+    """
+    Count per value of every facet field.
+
+    A field's counts apply the selections on every other field but not its
+    own, so choosing one department still shows how many jobs the others
+    have.
+    """
+    selected = selected or {}
+    counts = {field: Counter() for field in FACET_FIELDS}
+    for values, count in combinations:
+        misses = [
+            i for i, field in enumerate(FACET_FIELDS)
+            if selected.get(field) and values[i] not in selected[field]
+        ]
+        if len(misses) > 1:
+            continue
+        for i, field in enumerate(FACET_FIELDS):
+            if values[i] and misses in ([], [i]):
+                counts[field][values[i]] += count
+    return {
+        field: [
+            {'value': value, 'count': count, 'selected': value in selected.get(field, ())}
+            for value, count in sorted(counts[field].items())
+        ]
+        for field in FACET_FIELDS
+    }
+
+
+def facet_values(field):
+    """(value, count) pairs for one field over all open jobs."""
+    return [(facet['value'], facet['count']) for facet in facet_counts(get_facet_index())[field]]
+
+
+def selected_facets(params):
+    selected = {}
+    for field in FACET_FIELDS:
+        values = [value.strip() for value in params.getlist(field) if value.strip() and value != 'all']
+        if field == 'location':
+            values = [normalize_location(value) for value in values]
+        selected[field] = values
+    return selected
+
+
+def search_jobs(params):
+    """
+    Open jobs matching ``params`` plus their facet counts.
+
+    ``params`` is a QueryDict: ``q`` is a free-text query (spelling-corrected,
+    see spelling.py) and each facet field may be given several times.
+    Returns ``(queryset, facets, correction)``.
+    """
+    selected = selected_facets(params)
+    queryset = JobPosting.objects.active()
+    correction = None
+
+    query = params.get('q', '').strip()
+    if query:
+        corrected, changed = correct_query(query)
+        correction = corrected if changed else None
+        for term in corrected.split():
+            condition = Q()
+            for field in SEARCH_FIELDS:
+                condition |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(condition)
+        combinations = _combinations(queryset)
+    else:
+        combinations = get_facet_index()
+
+    for field, values in selected.items():
+        if values:
+            queryset = queryset.filter(**{f'{field}__in': values})
+    return queryset.order_by('-created_at'), facet_counts(combinations, selected), correction
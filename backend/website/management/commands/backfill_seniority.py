@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from website.fragment_cache import bump_model_version
+from website.models import TeamMember
+
+class Command(BaseCommand):
+    help = 'Recomputes seniority and leadership flags for team members from their positions and leadership overrides'
+
+    def handle(self, *args, **options):
+        changed = []
+        for member in TeamMember.objects.only('pk', 'position', 'seniority', 'is_leadership', 'leadership_override'):
+            before = (member.seniority, member.is_leadership)
+            member.apply_seniority()
+            if (member.seniority, member.is_leadership) != before:
+                changed.append(member)
+
+        TeamMember.objects.bulk_update(changed, ['seniority', 'is_leadership'], batch_size=500)
+        if changed:
+            # bulk_update sends no signals, so invalidate cached team data here
+            bump_model_version(TeamMember)
+        self.stdout.write(self.style.SUCCESS(f'Updated seniority for {len(changed)} team members.'))
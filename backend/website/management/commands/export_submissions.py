@@ -0,0 +1,47 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+
+from website.exports import (
+    EXPORT_CHUNK_SIZE, EXPORT_DEFINITIONS, EXPORT_FORMATS,
+    ExportError, build_export_queryset, iter_export,
+)
+
+class Command(BaseCommand):
+    help = 'Exports job applications or resume submissions as CSV or NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=list(EXPORT_DEFINITIONS))
+        parser.add_argument('--format', dest='export_format', choices=EXPORT_FORMATS, default='csv')
+        parser.add_argument('--status', help='Only export rows with this status')
+        parser.add_argument('--job', help='Only export applications for this job posting id')
+        parser.add_argument('--from', dest='date_from', help='Created on or after (YYYY-MM-DD)')
+        parser.add_argument('--to', dest='date_to', help='Created on or before (YYYY-MM-DD)')
+        parser.add_argument('--output', '-o', help='Write to this file instead of stdout')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            queryset, headers = build_export_queryset(
+                options['kind'],
+                status=options['status'],
+                job=options['job'],
+                date_from=options['date_from'],
+                date_to=options['date_to'],
+            )
+            rows = iter_export(queryset, headers, options['export_format'], options['chunk_size'])
+        except ExportError as e:
+            raise CommandError(str(e))
+
+        output = options['output']
+        stream = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+        count = -1 if options['export_format'] == 'csv' else 0
+        try:
+            for line in rows:
+                stream.write(line)
+                count += 1
+        finally:
+            if output:
+                stream.close()
+
+        if output:
+            self.stderr.write(self.style.SUCCESS(f'Exported {count} rows to {output}'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from website.applicant_search import SEARCH_TYPES, extract_pending, reindex
+
+class Command(BaseCommand):
+    help = 'Extracts text from pending resume uploads and updates the applicant search index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help='Process at most this many submissions')
+        parser.add_argument('--workers', type=int, help='Number of extraction processes')
+        parser.add_argument('--retry-failed', action='store_true', help='Queue failed extractions again first')
+        parser.add_argument('--reindex', action='store_true', help='Rebuild the search index for every submission')
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            for model in SEARCH_TYPES.values():
+                model.objects.filter(resume_text_status='failed').update(resume_text_status='pending')
+
+        processed = extract_pending(limit=options['limit'], workers=options['workers'])
+        self.stdout.write(self.style.SUCCESS(f'Extracted resume text for {processed} submissions.'))
+
+        if options['reindex']:
+            for model in SEARCH_TYPES.values():
+                pks = list(model.objects.values_list('pk', flat=True))
+                for start in range(0, len(pks), 500):
+                    reindex(model, pks[start:start + 500])
+                self.stdout.write(self.style.SUCCESS(
+                    f'Reindexed {len(pks)} {model._meta.verbose_name_plural}.'
+                ))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from website.throttling import get_counter_store
+
+class Command(BaseCommand):
+    help = 'Deletes rate limit counters whose windows have expired'
+
+    def handle(self, *args, **options):
+        deleted = get_counter_store().prune()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} expired rate limit counters.'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from website.candidates import link_submissions, refresh_counters
+from website.models import Candidate, JobApplication, ResumeSubmission, email_digest, normalize_email
+
+class Command(BaseCommand):
+    help = 'Links unlinked submissions to candidates and recomputes candidate counters'
+
+    def handle(self, *args, **options):
+        linked = sum(
+            link_submissions(Candidate, model, email_digest, normalize_email)
+            for model in (JobApplication, ResumeSubmission)
+        )
+        refreshed = refresh_counters(Candidate, {
+            JobApplication: JobApplication.candidate_counter,
+            ResumeSubmission: ResumeSubmission.candidate_counter,
+        })
+        self.stdout.write(self.style.SUCCESS(
+            f'Linked {linked} submissions and refreshed {refreshed} candidates.'
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from website.models import JobPosting, Service
+from website.related import rebuild_related_index
+
+class Command(BaseCommand):
+    help = 'Recomputes the related services and related jobs lists'
+
+    def handle(self, *args, **options):
+        for model in (Service, JobPosting):
+            updated = rebuild_related_index(model)
+            self.stdout.write(self.style.SUCCESS(
+                f'Updated related lists for {updated} {model._meta.verbose_name_plural}.'
+            ))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from website.matching import text_vector
+from website.models import JobApplication, JobPosting
+
+class Command(BaseCommand):
+    help = 'Recomputes the skill matching vectors of job postings and job applications'
+
+    def handle(self, *args, **options):
+        jobs = list(JobPosting.objects.only('pk', 'title', 'requirements'))
+        for job in jobs:
+            job.skill_vector = text_vector(job.title, job.requirements)
+        JobPosting.objects.bulk_update(jobs, ['skill_vector'], batch_size=500)
+
+        updated = 0
+        batch = []
+        for application in JobApplication.objects.only('pk', 'cover_letter', 'resume_text').iterator(chunk_size=500):
+            application.skill_vector = text_vector(application.cover_letter, application.resume_text)
+            batch.append(application)
+            if len(batch) == 500:
+                updated += JobApplication.objects.bulk_update(batch, ['skill_vector'])
+                batch = []
+        updated += JobApplication.objects.bulk_update(batch, ['skill_vector'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Updated skill vectors for {len(jobs)} job postings and {updated} job applications.'
+        ))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from website.analytics import rebuild_rollups
+
+class Command(BaseCommand):
+    help = 'Recomputes the daily submission rollups from submissions and their status history'
+
+    def handle(self, *args, **options):
+        rows = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} submission rollup rows.'))
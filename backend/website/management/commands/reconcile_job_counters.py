@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from website.models import Candidate, JobPosting
+
+class Command(BaseCommand):
+    help = 'Recomputes the application counters of job postings and candidates; run hourly to age out the 24 hour count'
+
+    def handle(self, *args, **options):
+        jobs = JobPosting.objects.reconcile_application_counts()
+        candidates = Candidate.objects.reconcile_counts()
+        self.stdout.write(self.style.SUCCESS(
+            f'Reconciled application counters for {jobs} job postings and {candidates} candidates.'
+        ))
@@ -0,0 +1,151 @@
+import math
+import re
+import zlib
+from collections import Counter
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # Optional: scoring falls back to pure Python below
+    np = sparse = None
+
+
+# === Skill Matching ===
+#
+# Job requirements and candidate text (cover letters, resume text, skill
+# lists) are turned into sparse term vectors with the hashing trick: every
+# word and two-word phrase is hashed into one of N_FEATURES buckets, so no
+# vocabulary has to be stored or kept in sync. Vectors are computed when a
+# row is saved and stored with it as [[bucket, weight], ...].
+#
+# Ranking a pool of candidates against a job is then one sparse matrix
+# product: candidate rows are reweighted by inverse document frequency over
+# the pool, normalized, and multiplied by the job vector. With NumPy/SciPy
+# installed this takes milliseconds for thousands of candidates; without
+# them the same scores are computed with dictionaries.
+
+N_FEATURES = 1 << 18
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+
+STOP_WORDS = frozenset('''
+    a about able all also an and any are as at be been but by can do for from
+    get has have i if in into is it its me my not of on or our over so such
+    than that the their them they this to us using via was we were what when
+    which who will with within work working would year years you your
+'''.split())
+
+
+def words(text):
+    """Lowercased words without stop words and bare numbers."""
+    return [
+        word for word in TOKEN_PATTERN.findall((text or '').lower())
+        if word not in STOP_WORDS and not word.isdigit()
+    ]
+
+
+def terms(text):
+    """Words and adjacent word pairs."""
+    single = words(text)
+    return single + [f'{first} {second}' for first, second in zip(single, single[1:])]
+
+
+def _bucket(term):
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(term.encode('utf-8')) % N_FEATURES
+
+
+def text_vector(*texts):
+    """
+    Sparse L2-normalized vector of ``texts`` as sorted [bucket, weight] pairs.
+
+    Term counts are dampened (1 + log tf) so a word repeated throughout a
+    cover letter does not outweigh the rest of it.
+    """
+    counts = Counter(_bucket(term) for text in texts for term in terms(text))
+    weights = {bucket: 1 + math.log(count) for bucket, count in counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+    return [[bucket, round(weight / norm, 6)] for bucket, weight in sorted(weights.items())]
+
+
+def skills_text(skills):
+    return ', '.join(skill for skill in (skills or []) if isinstance(skill, str))
+
+
+def matched_terms(job_text, candidate_text, limit=10, candidate_terms=()):
+    """
+    Single-word terms the two texts share, in the job's order (for display).
+    ``candidate_terms`` adds words already known to be in the candidate's text.
+    """
+    candidate = set(words(candidate_text)) | set(candidate_terms)
+    shared = [word for word in dict.fromkeys(words(job_text)) if word in candidate]
+    return shared[:limit]
+
+
+# === Scoring ===
+
+def _idf(document_frequency, documents):
+    # Smoothed, so terms held by every candidate still count a little
+    return math.log((1 + documents) / (1 + document_frequency)) + 1
+
+
+def _score_python(job_vector, vectors):
+    document_frequency = Counter(bucket for vector in vectors for bucket, _ in vector)
+    idf = {bucket: _idf(document_frequency[bucket], len(vectors)) for bucket, _ in job_vector}
+    job = {bucket: weight * idf[bucket] for bucket, weight in job_vector}
+    job_norm = math.sqrt(sum(weight * weight for weight in job.values())) or 1.0
+
+    scores = []
+    for vector in vectors:
+        weighted = {bucket: weight * _idf(document_frequency[bucket], len(vectors)) for bucket, weight in vector}
+        norm = math.sqrt(sum(weight * weight for weight in weighted.values())) or 1.0
+        dot = sum(weight * job[bucket] for bucket, weight in weighted.items() if bucket in job)
+        scores.append(dot / (norm * job_norm))
+    return scores
+
+
+def _score_numpy(job_vector, vectors):
+    lengths = [len(vector) for vector in vectors]
+    buckets = np.fromiter((bucket for vector in vectors for bucket, _ in vector), dtype=np.int64, count=sum(lengths))
+    weights = np.fromiter((weight for vector in vectors for _, weight in vector), dtype=np.float64, count=sum(lengths))
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    candidates = sparse.csr_matrix((weights, buckets, indptr), shape=(len(vectors), N_FEATURES))
+
+    document_frequency = np.bincount(candidates.indices, minlength=N_FEATURES)
+    idf = np.log((1 + len(vectors)) / (1 + document_frequency)) + 1
+    candidates = candidates.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(candidates.multiply(candidates).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+
+    job_buckets = np.array([bucket for bucket, _ in job_vector], dtype=np.int64)
+    job_weights = np.array([weight for _, weight in job_vector], dtype=np.float64) * idf[job_buckets]
+    job = sparse.csr_matrix((job_weights, job_buckets, [0, len(job_buckets)]), shape=(1, N_FEATURES))
+    job_norm = np.linalg.norm(job_weights) or 1.0
+
+    scores = np.asarray((candidates @ job.T).todense()).ravel()
+    return (scores / (norms * job_norm)).tolist()
+
+
+def score_candidates(job_vector, vectors):
+    """
+    Cosine similarity of each candidate vector to the job vector, TF-IDF
+    weighted over the candidate pool. Returns one score per vector, 0..1.
+    """
+    if not job_vector or not vectors:
+        return [0.0] * len(vectors)
+    if sparse is None:
+        return _score_python(job_vector, vectors)
+    return _score_numpy(job_vector, vectors)
+
+
+def rank(job_vector, candidates, limit=None):
+    """
+    Rank ``candidates``, an iterable of (key, vector) pairs, by their score
+    against ``job_vector``. Returns [(key, score), ...], best first.
+    """
+    keys, vectors = [], []
+    for key, vector in candidates:
+        keys.append(key)
+        vectors.append(vector or [])
+    ranked = sorted(zip(keys, score_candidates(job_vector, vectors)), key=lambda pair: -pair[1])
+    return ranked[:limit] if limit else ranked
@@ -1,8 +1,11 @@
 from django.utils.deprecation import MiddlewareMixin
 from django.conf import settings
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 import secrets
 import logging
 
+from .db_router import STICKY_COOKIE, read_from_replicas
+
 logger = logging.getLogger('django.security')
 
 class SecurityHeadersMiddleware(MiddlewareMixin):
@@ -14,8 +17,9 @@ class SecurityHeadersMiddleware(MiddlewareMixin):
     """
     
     def process_response(self, request, response):
-        # Generate a random nonce for CSP
-        nonce = secrets.token_urlsafe(16)
+        # Reuse the nonce already rendered into the page, if any, so the
+        # header matches the template; otherwise generate a fresh one
+        nonce = getattr(request, 'csp_nonce', None) or secrets.token_urlsafe(16)
         
         # Content Security Policy (CSP)
         csp_directives = [
@@ -69,4 +73,55 @@ class SecurityHeadersMiddleware(MiddlewareMixin):
         # Store the nonce in the request for template use
         request.csp_nonce = nonce
         
-        return response
\ No newline at end of file
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let safe API requests read from replica databases.
+
+    Only paths under REPLICA_PATH_PREFIXES qualify; the admin and
+    server-rendered pages always read from the primary, so staff see their
+    own edits. After a client makes a successful write request it gets a
+    short-lived cookie, and its reads stay on the primary until the cookie
+    expires, so it always sees its own submissions despite replication lag.
+    """
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    REPLICA_PATH_PREFIXES = ('/api/',)
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with read_from_replicas(self._use_replicas(request)):
+            response = self.get_response(request)
+        return self._mark_writer(request, response)
+
+    async def __acall__(self, request):
+        with read_from_replicas(self._use_replicas(request)):
+            response = await self.get_response(request)
+        return self._mark_writer(request, response)
+
+    def _use_replicas(self, request):
+        return (
+            request.method in self.SAFE_METHODS
+            and request.path.startswith(self.REPLICA_PATH_PREFIXES)
+            and STICKY_COOKIE not in request.COOKIES
+        )
+
+    def _mark_writer(self, request, response):
+        if request.method not in self.SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                STICKY_COOKIE, '1',
+                max_age=getattr(settings, 'DATABASE_REPLICA_STICKY_SECONDS', 15),
+                httponly=True,
+                samesite='Lax',
+                secure=request.is_secure(),
+            )
+        return response
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-19 12:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('website', '0006_alter_jobposting_options_jobposting_experience_level_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=50)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('from_status', models.CharField(max_length=20)),
+                ('to_status', models.CharField(max_length=20)),
+                ('note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='status_changes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Status Change',
+                'verbose_name_plural': 'Status Changes',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['model_name', 'object_id'], name='website_sta_model_n_a84162_idx'), models.Index(fields=['created_at'], name='website_sta_created_4d11f6_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0007_statuschange'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimitCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=200, unique=True)),
+                ('window', models.BigIntegerField()),
+                ('current', models.PositiveIntegerField(default=0)),
+                ('previous', models.PositiveIntegerField(default=0)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
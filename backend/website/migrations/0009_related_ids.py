@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:40
+
+from django.db import migrations, models
+
+
+def build_related_index(apps, schema_editor):
+    from website.related import job_tags, rank_neighbours, service_tags
+
+    Service = apps.get_model('website', 'Service')
+    JobPosting = apps.get_model('website', 'JobPosting')
+
+    services = Service.objects.order_by('-created_at', '-pk').values_list('pk', 'title', 'tech_stack')
+    index = rank_neighbours([(pk, service_tags(title, tech_stack)) for pk, title, tech_stack in services])
+    for pk, related_ids in index.items():
+        Service.objects.filter(pk=pk).update(related_ids=related_ids)
+
+    jobs = JobPosting.objects.filter(is_active=True).order_by('-created_at', '-pk').values_list(
+        'pk', 'title', 'department', 'requirements'
+    )
+    index = rank_neighbours([(pk, job_tags(*row)) for pk, *row in jobs])
+    for pk, related_ids in index.items():
+        JobPosting.objects.filter(pk=pk).update(related_ids=related_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0008_ratelimitcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='related_ids',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Ranked ids of similar open jobs'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='related_ids',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Ranked ids of similar services'),
+        ),
+        migrations.RunPython(build_related_index, migrations.RunPython.noop),
+    ]
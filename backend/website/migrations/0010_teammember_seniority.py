@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+def fill_seniority(apps, schema_editor):
+    from website.models import seniority_rank
+
+    TeamMember = apps.get_model('website', 'TeamMember')
+    for pk, position in TeamMember.objects.values_list('pk', 'position'):
+        TeamMember.objects.filter(pk=pk).update(seniority=seniority_rank(position))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0009_related_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='seniority',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text='Rank derived from the position title'),
+        ),
+        migrations.RunPython(fill_seniority, migrations.RunPython.noop),
+    ]
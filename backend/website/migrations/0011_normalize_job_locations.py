@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-19 14:40
+
+from django.db import migrations
+
+
+def normalize_locations(apps, schema_editor):
+    from website.models import normalize_location
+
+    JobPosting = apps.get_model('website', 'JobPosting')
+    for pk, department, location in JobPosting.objects.values_list('pk', 'department', 'location'):
+        normalized = {'department': ' '.join(department.split()), 'location': normalize_location(location)}
+        if normalized != {'department': department, 'location': location}:
+            JobPosting.objects.filter(pk=pk).update(**normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0010_teammember_seniority'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_locations, migrations.RunPython.noop),
+    ]
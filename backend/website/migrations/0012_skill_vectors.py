@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+def build_skill_vectors(apps, schema_editor):
+    from website.matching import text_vector
+
+    JobPosting = apps.get_model('website', 'JobPosting')
+    JobApplication = apps.get_model('website', 'JobApplication')
+
+    for pk, title, requirements in JobPosting.objects.values_list('pk', 'title', 'requirements'):
+        JobPosting.objects.filter(pk=pk).update(skill_vector=text_vector(title, requirements))
+    for pk, cover_letter in JobApplication.objects.values_list('pk', 'cover_letter').iterator(chunk_size=500):
+        JobApplication.objects.filter(pk=pk).update(skill_vector=text_vector(cover_letter))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0011_normalize_job_locations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='skill_vector',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Hashed term vector of the cover letter'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='skill_vector',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Hashed term vector of the title and requirements'),
+        ),
+        migrations.RunPython(build_skill_vectors, migrations.RunPython.noop),
+    ]
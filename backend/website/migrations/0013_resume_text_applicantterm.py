@@ -0,0 +1,53 @@
+# Generated by Django 5.0.1 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0012_skill_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Extracted'), ('none', 'No File'), ('unsupported', 'Unsupported Format'), ('failed', 'Failed')], db_index=True, default='pending', editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='resumesubmission',
+            name='resume_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resumesubmission',
+            name='resume_text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Extracted'), ('none', 'No File'), ('unsupported', 'Unsupported Format'), ('failed', 'Failed')], db_index=True, default='pending', editable=False, max_length=12),
+        ),
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='skill_vector',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Hashed term vector of the cover letter and resume text'),
+        ),
+        migrations.CreateModel(
+            name='ApplicantTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=50)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('term', models.CharField(max_length=50)),
+                ('weight', models.FloatField()),
+            ],
+            options={
+                'verbose_name': 'Applicant Term',
+                'verbose_name_plural': 'Applicant Terms',
+                'indexes': [models.Index(fields=['term', 'model_name'], name='website_app_term_447916_idx'), models.Index(fields=['model_name', 'object_id'], name='website_app_model_n_f46a8e_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.1 on 2026-10-19 16:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_candidates(apps, schema_editor):
+    from website.candidates import link_submissions, refresh_counters
+    from website.models import email_digest, normalize_email
+
+    Candidate = apps.get_model('website', 'Candidate')
+    JobApplication = apps.get_model('website', 'JobApplication')
+    ResumeSubmission = apps.get_model('website', 'ResumeSubmission')
+
+    for model in (JobApplication, ResumeSubmission):
+        link_submissions(Candidate, model, email_digest, normalize_email)
+    refresh_counters(Candidate, {JobApplication: 'application_count', ResumeSubmission: 'resume_count'})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0013_resume_text_applicantterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Candidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email_hash', models.CharField(max_length=64, unique=True)),
+                ('email', models.EmailField(max_length=254)),
+                ('name', models.CharField(blank=True, max_length=100)),
+                ('application_count', models.PositiveIntegerField(default=0)),
+                ('resume_count', models.PositiveIntegerField(default=0)),
+                ('latest_status', models.CharField(blank=True, max_length=20)),
+                ('last_activity_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Candidate',
+                'verbose_name_plural': 'Candidates',
+                'ordering': ['-last_activity_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='candidate',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)ss', to='website.candidate'),
+        ),
+        migrations.AddField(
+            model_name='resumesubmission',
+            name='candidate',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)ss', to='website.candidate'),
+        ),
+        migrations.RunPython(link_candidates, migrations.RunPython.noop),
+    ]
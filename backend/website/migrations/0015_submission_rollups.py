@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0014_candidate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=50)),
+                ('date', models.DateField()),
+                ('job_id', models.PositiveBigIntegerField(default=0)),
+                ('status', models.CharField(max_length=20)),
+                ('source', models.CharField(blank=True, max_length=50)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Submission Rollup',
+                'verbose_name_plural': 'Submission Rollups',
+            },
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='source',
+            field=models.CharField(blank=True, help_text='Where the application came from, e.g. a utm_source or referring site', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='resumesubmission',
+            name='source',
+            field=models.CharField(blank=True, help_text='Where the submission came from, e.g. a utm_source or referring site', max_length=50),
+        ),
+        migrations.AddConstraint(
+            model_name='submissionrollup',
+            constraint=models.UniqueConstraint(fields=('model_name', 'date', 'job_id', 'status', 'source'), name='unique_submission_rollup'),
+        ),
+    ]
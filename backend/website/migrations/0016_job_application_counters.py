@@ -0,0 +1,57 @@
+# Generated by Django 5.0.1 on 2026-10-19 17:05
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def count_applications(apps, schema_editor):
+    JobApplication = apps.get_model('website', 'JobApplication')
+    JobPosting = apps.get_model('website', 'JobPosting')
+
+    def count(**filters):
+        applications = JobApplication.objects.filter(job=OuterRef('pk'), **filters).order_by()
+        return Coalesce(Subquery(applications.values('job').annotate(total=Count('pk')).values('total')), 0)
+
+    JobPosting.objects.update(
+        application_count=count(),
+        new_application_count=count(status='new'),
+        recent_application_count=count(created_at__gte=timezone.now() - timedelta(hours=24)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0015_submission_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='new_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Applications not yet reviewed'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='recent_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Applications in the last 24 hours'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', '-recent_application_count'], name='website_job_is_acti_25a07d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', '-application_count'], name='website_job_is_acti_775ce0_idx'),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.1 on 2026-10-19 17:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_existing_skills(apps, schema_editor):
+    from website.skills import link_skills, refresh_member_counts
+
+    Skill = apps.get_model('website', 'Skill')
+    TeamMember = apps.get_model('website', 'TeamMember')
+    TeamMemberSkill = apps.get_model('website', 'TeamMemberSkill')
+    for member in TeamMember.objects.all():
+        link_skills(Skill, TeamMemberSkill, member, member.skills)
+    refresh_member_counts(Skill, TeamMemberSkill)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0016_job_application_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Lowercased name, used for matching', max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('member_count', models.PositiveIntegerField(db_index=True, default=0)),
+            ],
+            options={
+                'verbose_name': 'Skill',
+                'verbose_name_plural': 'Skills',
+                'ordering': ['-member_count', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamMemberSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='website.teammember')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='member_links', to='website.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='skill_set',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Normalized copy of skills, maintained on save', related_name='members', through='website.TeamMemberSkill', to='website.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='teammemberskill',
+            index=models.Index(fields=['skill', 'member'], name='website_tea_skill_i_bbdd71_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='teammemberskill',
+            constraint=models.UniqueConstraint(fields=('member', 'skill'), name='unique_team_member_skill'),
+        ),
+        migrations.RunPython(link_existing_skills, migrations.RunPython.noop),
+    ]
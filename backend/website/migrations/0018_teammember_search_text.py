@@ -0,0 +1,46 @@
+# Generated by Django 5.0.1 on 2026-10-19 17:55
+
+from django.db import migrations, models
+
+
+def fill_search_text(apps, schema_editor):
+    from website.skills import clean_skills
+
+    TeamMember = apps.get_model('website', 'TeamMember')
+    for member in TeamMember.objects.all():
+        parts = (member.name, member.position, member.department, *(name for _, name in clean_skills(member.skills)))
+        TeamMember.objects.filter(pk=member.pk).update(search_text=' '.join(part for part in parts if part))
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm only exists on Postgres; other backends use the in-memory index
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS website_teammember_search_trgm '
+        'ON website_teammember USING gin (search_text gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS website_teammember_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0017_skills'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, help_text='Name, position, department and skills, for people search'),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:20
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_tables(apps, schema_editor):
+    # Creates the table of every DatabaseCache in CACHES (the 'versions' alias
+    # without Redis); a no-op for other backends or if it already exists
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0018_teammember_search_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
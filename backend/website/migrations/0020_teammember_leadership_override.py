@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+def keep_manual_leadership(apps, schema_editor):
+    # is_leadership used to be edited by hand; members whose flag disagrees
+    # with their position keep it through an explicit override. Seniority is
+    # recomputed first, since databases migrated past 0010 before it filled
+    # the column still hold 0 for every existing member.
+    from website.models import is_leadership_rank, seniority_rank
+
+    TeamMember = apps.get_model('website', 'TeamMember')
+    for pk, position, seniority, is_leadership in TeamMember.objects.values_list(
+        'pk', 'position', 'seniority', 'is_leadership'
+    ):
+        rank = seniority_rank(position)
+        values = {'seniority': rank} if rank != seniority else {}
+        if is_leadership != is_leadership_rank(rank):
+            values['leadership_override'] = is_leadership
+        if values:
+            TeamMember.objects.filter(pk=pk).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0019_version_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='leadership_override',
+            field=models.BooleanField(blank=True, help_text='Force this member into (Yes) or out of (No) the leadership team; leave unknown to follow the position', null=True),
+        ),
+        migrations.AlterField(
+            model_name='teammember',
+            name='is_leadership',
+            field=models.BooleanField(default=False, editable=False, help_text='Derived from the seniority rank unless overridden'),
+        ),
+        migrations.RunPython(keep_manual_leadership, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0020_teammember_leadership_override'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobposting',
+            name='recent_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Applications in the last 24 hours; overstated until the next reconcile_job_counters run'),
+        ),
+    ]
@@ -1,8 +1,19 @@
-from django.db import models
+import hashlib
+import re
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 from django.utils.text import slugify
 from django.core.validators import FileExtensionValidator
 from django.core.exceptions import ValidationError
 from .storage import SecureFileStorage
+from .matching import text_vector
+from .skills import clean_skills, link_skills, refresh_member_counts, skill_key
 
 
 # === Reusable Constants & Helpers ===
@@ -49,6 +60,60 @@ class AutoSlugMixin(models.Model):
         super().save(*args, **kwargs)
 
 
+class ResumeTextMixin(models.Model):
+    """Text of the uploaded resume, filled in off the request path (see applicant_search.py)."""
+    RESUME_TEXT_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('done', 'Extracted'),
+        ('none', 'No File'),
+        ('unsupported', 'Unsupported Format'),
+        ('failed', 'Failed'),
+    ]
+    resume_text = models.TextField(blank=True, editable=False)
+    resume_text_status = models.CharField(
+        max_length=12, choices=RESUME_TEXT_STATUS_CHOICES, default='pending', editable=False, db_index=True
+    )
+
+    class Meta:
+        abstract = True
+
+
+class CandidateLinkMixin(models.Model):
+    """
+    Links a submission to its Candidate when it is inserted and keeps the
+    candidate's counters and the daily SubmissionRollup counts current.
+    ``candidate_counter`` names the Candidate field counting this kind of
+    submission.
+    """
+    candidate = models.ForeignKey(
+        'Candidate', on_delete=models.SET_NULL, null=True, blank=True, editable=False,
+        related_name='%(class)ss'
+    )
+    candidate_counter = None
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if adding and self.candidate_id is None and self.email:
+            self.candidate = Candidate.objects.for_email(self.email, self.name)
+        previous_status = None
+        if not adding:
+            previous_status = type(self).objects.filter(pk=self.pk).values_list('status', flat=True).first()
+        super().save(*args, **kwargs)
+        if adding or previous_status != self.status:
+            self.record_status(previous_status)
+
+    def record_status(self, previous_status):
+        """Count an insert (``previous_status`` None) or a status change."""
+        SubmissionRollup.objects.record(type(self), self.status, [(getattr(self, 'job_id', None), self.source)])
+        if self.candidate_id:
+            Candidate.objects.record_activity(
+                [self.candidate_id], self.status, counter=self.candidate_counter if previous_status is None else None
+            )
+
+
 # === Models ===
 
 class Service(AutoSlugMixin):
@@ -65,6 +130,7 @@ class Service(AutoSlugMixin):
     )
     price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     tech_stack = models.CharField(max_length=500, blank=True, help_text='Comma-separated list of technologies')
+    related_ids = models.JSONField(default=list, blank=True, editable=False, help_text='Ranked ids of similar services')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -72,15 +138,63 @@ class Service(AutoSlugMixin):
         return f"{self.title}"
 
 
-# Add this in models.py (JobPosting)
+# Location spellings that all mean a fully remote position
+REMOTE_LOCATIONS = {'remote', 'anywhere', 'wfh', 'work from home', 'fully remote', 'remote only'}
+
+
+def normalize_location(value):
+    """
+    Canonical form of a job location, applied on save.
+
+    Whitespace is collapsed, remote variants become "Remote" and lowercase
+    parts are title-cased ("new york, NY" -> "New York, NY"), so the same
+    place is always stored, filtered and counted under one value.
+    """
+    value = ' '.join((value or '').split())
+    if value.lower() in REMOTE_LOCATIONS:
+        return 'Remote'
+    parts = [part.strip() for part in value.split(',') if part.strip()]
+    return ', '.join(part.title() if part.islower() else part for part in parts)
+
 
-class JobPostingManager(models.Manager):
+# Window of JobPosting.recent_application_count
+RECENT_APPLICATIONS_WINDOW = timedelta(hours=24)
+
+
+class JobPostingQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_active=True)
 
-class JobPosting(models.Model):
-    ...
-    objects = JobPostingManager()
+    def adjust_application_counts(self, job_id, total=0, new=0, recent=0):
+        """Apply deltas to one job's application counters with a single UPDATE."""
+        deltas = {
+            'application_count': total,
+            'new_application_count': new,
+            'recent_application_count': recent,
+        }
+        # Clamped at zero, so a counter that drifted low cannot fail the UPDATE
+        values = {field: Greatest(F(field) + delta, 0) for field, delta in deltas.items() if delta}
+        if not job_id or not values:
+            return 0
+        return self.filter(pk=job_id).update(**values)
+
+    def reconcile_application_counts(self):
+        """
+        Recompute every job's counters from its applications in one UPDATE.
+
+        Run periodically: it also ages applications out of the 24 hour count,
+        which increments alone cannot do.
+        """
+        def count(**filters):
+            applications = JobApplication.objects.filter(job=OuterRef('pk'), **filters).order_by()
+            return Coalesce(Subquery(applications.values('job').annotate(total=Count('pk')).values('total')), 0)
+
+        return self.update(
+            application_count=count(),
+            new_application_count=count(status='new'),
+            recent_application_count=count(created_at__gte=timezone.now() - RECENT_APPLICATIONS_WINDOW),
+        )
+
 
 class JobPosting(AutoSlugMixin):
     title = models.CharField(max_length=200)
@@ -98,31 +212,115 @@ class JobPosting(AutoSlugMixin):
     ])
     salary_range = models.CharField(max_length=100, blank=True)
     experience_level = models.CharField(max_length=50, blank=True)
+    related_ids = models.JSONField(default=list, blank=True, editable=False, help_text='Ranked ids of similar open jobs')
+    skill_vector = models.JSONField(default=list, blank=True, editable=False, help_text='Hashed term vector of the title and requirements')
+    # Maintained by JobApplication saves and deletes and the review workflow
+    # (which moves applications in and out of 'new'), and reconciled by the
+    # reconcile_job_counters command. Only that command ages applications out
+    # of the 24 hour count.
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+    new_application_count = models.PositiveIntegerField(default=0, editable=False, help_text='Applications not yet reviewed')
+    recent_application_count = models.PositiveIntegerField(
+        default=0, editable=False,
+        help_text='Applications in the last 24 hours; overstated until the next reconcile_job_counters run'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = JobPostingQuerySet.as_manager()
+
+    COUNTER_FIELDS = ('application_count', 'new_application_count', 'recent_application_count')
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Job Posting"
         verbose_name_plural = "Job Postings"
+        indexes = [
+            models.Index(fields=['is_active', '-recent_application_count']),
+            models.Index(fields=['is_active', '-application_count']),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.department})"
 
+    def save(self, *args, **kwargs):
+        self.department = ' '.join(self.department.split())
+        self.location = normalize_location(self.location)
+        self.skill_vector = text_vector(self.title, self.requirements)
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Never write back counters loaded before concurrent applications came in
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+# Position keywords and the seniority rank they imply. The highest matching
+# rank is stored on save; members at or above the leadership rank are
+# flagged as leadership. Both can be overridden in settings.
+DEFAULT_SENIORITY_RANKS = {
+    'founder': 100,
+    'ceo': 100,
+    'cto': 90,
+    'chief': 90,
+    'president': 90,
+    'vp': 80,
+    'head': 70,
+    'director': 70,
+    'manager': 50,
+    'lead': 50,
+    'leader': 50,
+    'principal': 40,
+    'senior': 30,
+}
+DEFAULT_LEADERSHIP_MIN_RANK = 50
+
 
+def seniority_rank(position):
+    ranks = getattr(settings, 'TEAM_SENIORITY_RANKS', DEFAULT_SENIORITY_RANKS)
+    words = set(re.findall(r'[a-z]+', (position or '').lower()))
+    return max((rank for keyword, rank in ranks.items() if keyword in words), default=0)
 
-# Add this for TeamMember
 
-class TeamMemberManager(models.Manager):
+def is_leadership_rank(rank):
+    return rank >= getattr(settings, 'TEAM_LEADERSHIP_MIN_RANK', DEFAULT_LEADERSHIP_MIN_RANK)
+
+
+class TeamMemberQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_active=True)
-    
+
+    def with_skills(self):
+        """Prefetch each member's skills in list order, for primary_skills."""
+        return self.prefetch_related(models.Prefetch(
+            'skill_links', queryset=TeamMemberSkill.objects.select_related('skill').order_by('position')
+        ))
+
+    def with_all_skills(self, names):
+        """Members having every skill in ``names``, matched case-insensitively through the link index."""
+        keys = {skill_key(name) for name in names if str(name).strip()}
+        if not keys:
+            return self
+        skill_ids = list(Skill.objects.filter(key__in=keys).values_list('pk', flat=True))
+        if len(skill_ids) < len(keys):
+            return self.none()
+        matching = (
+            TeamMemberSkill.objects.filter(skill_id__in=skill_ids)
+            .values('member_id').annotate(matched=Count('skill_id')).filter(matched=len(skill_ids))
+            .values('member_id')
+        )
+        return self.filter(pk__in=matching)
+
     def ordered(self):
         return self.active().order_by('order', 'name')
 
-class TeamMember(models.Model):
-    ...
-    objects = TeamMemberManager()
+    def leadership(self):
+        return self.active().filter(is_leadership=True).order_by('order', '-seniority', 'name')
+
+    def highlights(self):
+        """Leadership first, then by seniority and experience."""
+        return self.active().order_by('-is_leadership', '-seniority', '-years_experience', 'order', 'name')
 
 
 class TeamMember(models.Model):
@@ -143,16 +341,28 @@ class TeamMember(models.Model):
     email = models.EmailField(blank=True)
 
     skills = models.JSONField(default=list, blank=True)
+    skill_set = models.ManyToManyField(
+        'Skill', through='TeamMemberSkill', related_name='members', blank=True, editable=False,
+        help_text='Normalized copy of skills, maintained on save'
+    )
     years_experience = models.PositiveIntegerField(default=0)
     achievements = models.JSONField(default=list, blank=True)
 
     is_active = models.BooleanField(default=True)
-    is_leadership = models.BooleanField(default=False)
+    is_leadership = models.BooleanField(default=False, editable=False, help_text='Derived from the seniority rank unless overridden')
+    leadership_override = models.BooleanField(
+        null=True, blank=True,
+        help_text='Force this member into (Yes) or out of (No) the leadership team; leave unknown to follow the position'
+    )
+    seniority = models.PositiveSmallIntegerField(default=0, editable=False, help_text='Rank derived from the position title')
+    search_text = models.TextField(blank=True, editable=False, help_text='Name, position, department and skills, for people search')
     order = models.IntegerField(default=0)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TeamMemberQuerySet.as_manager()
+
     class Meta:
         ordering = ['order', 'name']
         verbose_name = "Team Member"
@@ -172,13 +382,62 @@ class TeamMember(models.Model):
 
     @property
     def primary_skills(self):
-        return self.skills[:5] if self.skills else []
+        return [link.skill.name for link in self.skill_links.all()[:5]]
+
+    def apply_seniority(self):
+        """
+        Derive seniority from the position, and is_leadership from that rank
+        in both directions unless leadership_override pins it either way.
+        """
+        self.seniority = seniority_rank(self.position)
+        if self.leadership_override is None:
+            self.is_leadership = is_leadership_rank(self.seniority)
+        else:
+            self.is_leadership = self.leadership_override
 
     def save(self, *args, **kwargs):
-        leadership_keywords = ['director', 'manager', 'lead', 'head', 'ceo', 'cto', 'founder', 'vp']
-        if any(keyword in self.position.lower() for keyword in leadership_keywords):
-            self.is_leadership = True
-        super().save(*args, **kwargs)
+        self.apply_seniority()
+        self.search_text = ' '.join(
+            part for part in (self.name, self.position, self.department, *(name for _, name in clean_skills(self.skills)))
+            if part
+        )
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            refresh_member_counts(Skill, TeamMemberSkill, link_skills(Skill, TeamMemberSkill, self, self.skills))
+
+
+class Skill(models.Model):
+    """A distinct team skill, with the number of active members who list it."""
+    key = models.CharField(max_length=100, unique=True, help_text='Lowercased name, used for matching')
+    name = models.CharField(max_length=100)
+    member_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    class Meta:
+        ordering = ['-member_count', 'name']
+        verbose_name = "Skill"
+        verbose_name_plural = "Skills"
+
+    def __str__(self):
+        return f"{self.name} ({self.member_count})"
+
+
+class TeamMemberSkill(models.Model):
+    """Link between a team member and a skill; ``position`` keeps the member's own ordering."""
+    member = models.ForeignKey(TeamMember, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='member_links')
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['member', 'skill'], name='unique_team_member_skill'),
+        ]
+        indexes = [
+            # Skill-first, for filtering members by skill
+            models.Index(fields=['skill', 'member']),
+        ]
+
+    def __str__(self):
+        return f"{self.member_id}: {self.skill_id}"
 
 
 class ContactMessage(models.Model):
@@ -193,7 +452,156 @@ class ContactMessage(models.Model):
         return f"{self.name} ({self.email}) - {self.subject}"
 
 
-class ResumeSubmission(models.Model):
+def normalize_email(email):
+    """
+    Canonical form of an address for matching submissions to one person.
+
+    Case and any "+tag" suffix are dropped; for Gmail, dots in the local part
+    are dropped too since Gmail ignores them.
+    """
+    local, _, domain = (email or '').strip().lower().rpartition('@')
+    if not local:
+        return domain
+    local = local.split('+', 1)[0]
+    if domain in ('gmail.com', 'googlemail.com'):
+        local, domain = local.replace('.', ''), 'gmail.com'
+    return f"{local}@{domain}"
+
+
+def email_digest(email):
+    return hashlib.sha256(normalize_email(email).encode('utf-8')).hexdigest()
+
+
+class CandidateManager(models.Manager):
+    def for_email(self, email, name=''):
+        candidate, _ = self.get_or_create(
+            email_hash=email_digest(email),
+            defaults={'email': normalize_email(email), 'name': name},
+        )
+        return candidate
+
+    def record_activity(self, pks, status, counter=None):
+        """Stamp new activity on candidates with one UPDATE, bumping ``counter`` if given."""
+        values = {'last_activity_at': timezone.now(), 'latest_status': status}
+        if counter:
+            values[counter] = F(counter) + 1
+        return self.filter(pk__in=pks).update(**values)
+
+    def uncount(self, pk, counter):
+        """Take one deleted submission off a candidate's ``counter``, clamped at zero."""
+        if pk is None:
+            return 0
+        return self.filter(pk=pk).update(**{counter: Greatest(F(counter) - 1, 0)})
+
+    def reconcile_counts(self):
+        """Recompute every candidate's submission counters from the submissions in one UPDATE."""
+        def count(model):
+            submissions = model.objects.filter(candidate=OuterRef('pk')).order_by()
+            return Coalesce(Subquery(submissions.values('candidate').annotate(total=Count('pk')).values('total')), 0)
+
+        return self.update(**{
+            model.candidate_counter: count(model) for model in (JobApplication, ResumeSubmission)
+        })
+
+
+class Candidate(models.Model):
+    """
+    One person across all their job applications and resume submissions,
+    identified by a hash of their normalized email address.
+    """
+    email_hash = models.CharField(max_length=64, unique=True)
+    email = models.EmailField()
+    name = models.CharField(max_length=100, blank=True)
+    application_count = models.PositiveIntegerField(default=0)
+    resume_count = models.PositiveIntegerField(default=0)
+    latest_status = models.CharField(max_length=20, blank=True)
+    last_activity_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = CandidateManager()
+
+    class Meta:
+        ordering = ['-last_activity_at']
+        verbose_name = "Candidate"
+        verbose_name_plural = "Candidates"
+
+    def __str__(self):
+        return f"{self.name or self.email} ({self.application_count} applications)"
+
+    def activity(self):
+        """Every application and resume submission of this candidate, newest first, in one query."""
+        fields = ('pk', 'kind', 'title', 'status', 'created_at')
+        applications = self.jobapplications.annotate(
+            kind=Value('application'), title=F('job__title')
+        ).order_by().values(*fields)
+        resumes = self.resumesubmissions.annotate(
+            kind=Value('resume'), title=Value('', output_field=models.CharField())
+        ).order_by().values(*fields)
+        return applications.union(resumes, all=True).order_by('-created_at')
+
+
+class SubmissionRollupManager(models.Manager):
+    def record(self, model, status, keys, day=None):
+        """
+        Count submissions entering ``status`` today.
+
+        ``keys`` holds one ``(job_id, source)`` pair per submission; each
+        distinct pair costs one UPDATE, or an INSERT the first time it is seen
+        on a day.
+        """
+        day = day or timezone.localdate()
+        model_name = model._meta.model_name
+        for (job_id, source), count in Counter((job_id or 0, source or '') for job_id, source in keys).items():
+            row = self.filter(
+                model_name=model_name, date=day, job_id=job_id, status=status, source=source
+            )
+            with transaction.atomic():
+                if row.update(count=F('count') + count):
+                    continue
+                try:
+                    with transaction.atomic():
+                        self.create(
+                            model_name=model_name, date=day, job_id=job_id, status=status, source=source, count=count
+                        )
+                except IntegrityError:
+                    # Another request created the row first
+                    row.update(count=F('count') + count)
+
+
+class SubmissionRollup(models.Model):
+    """
+    Daily count of submissions entering a status, per job and per source.
+
+    Inserts count towards 'new' and every status change towards its target
+    status, so a day's row for 'interview' says how many submissions reached
+    the interview stage that day. ``job_id`` is 0 for resume submissions and
+    for applications whose job was deleted. Rebuilt from the submissions and
+    their StatusChange history by the rebuild_submission_rollups command.
+    """
+    model_name = models.CharField(max_length=50)
+    date = models.DateField()
+    job_id = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=20)
+    source = models.CharField(max_length=50, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    objects = SubmissionRollupManager()
+
+    class Meta:
+        verbose_name = "Submission Rollup"
+        verbose_name_plural = "Submission Rollups"
+        constraints = [
+            # Leads with (model_name, date) so it also serves the dashboard's range scans
+            models.UniqueConstraint(
+                fields=['model_name', 'date', 'job_id', 'status', 'source'], name='unique_submission_rollup'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} {self.date} job #{self.job_id} {self.status}/{self.source or 'unknown'}: {self.count}"
+
+
+class ResumeSubmission(ResumeTextMixin, CandidateLinkMixin):
     name = models.CharField(max_length=100)
     email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True, null=True)
@@ -211,6 +619,9 @@ class ResumeSubmission(models.Model):
         ('hired', 'Hired')
     ], default='new')
     notes = models.TextField(blank=True)
+    source = models.CharField(max_length=50, blank=True, help_text='Where the submission came from, e.g. a utm_source or referring site')
+
+    candidate_counter = 'resume_count'
 
     class Meta:
         ordering = ['-created_at']
@@ -231,7 +642,7 @@ class ResumeSubmission(models.Model):
         return super().clean()
 
 
-class JobApplication(models.Model):
+class JobApplication(ResumeTextMixin, CandidateLinkMixin):
     job = models.ForeignKey(JobPosting, on_delete=models.SET_NULL, null=True, related_name='applications')
     name = models.CharField(max_length=100)
     email = models.EmailField()
@@ -251,6 +662,10 @@ class JobApplication(models.Model):
     ], default='new')
     notes = models.TextField(blank=True)
     email_sent = models.BooleanField(default=False)
+    source = models.CharField(max_length=50, blank=True, help_text='Where the application came from, e.g. a utm_source or referring site')
+    skill_vector = models.JSONField(default=list, blank=True, editable=False, help_text='Hashed term vector of the cover letter and resume text')
+
+    candidate_counter = 'application_count'
 
     class Meta:
         ordering = ['-created_at']
@@ -267,7 +682,87 @@ class JobApplication(models.Model):
         job_title = self.job.title if self.job else "Unknown Job"
         return f"{self.name} - {job_title} - {self.created_at.strftime('%Y-%m-%d')}"
 
+    def save(self, *args, **kwargs):
+        self.skill_vector = text_vector(self.cover_letter, self.resume_text)
+        super().save(*args, **kwargs)
+
+    def record_status(self, previous_status):
+        super().record_status(previous_status)
+        if previous_status is None:
+            JobPosting.objects.adjust_application_counts(
+                self.job_id, total=1, new=int(self.status == 'new'), recent=1
+            )
+        else:
+            JobPosting.objects.adjust_application_counts(
+                self.job_id, new=int(self.status == 'new') - int(previous_status == 'new')
+            )
+
     def clean(self):
         if not self.resume_file and not self.resume_link:
             raise ValidationError("Either a resume file or a link to a resume must be provided.")
         return super().clean()
+
+
+class StatusChange(models.Model):
+    """Audit trail entry for a review-status change on a submission."""
+    model_name = models.CharField(max_length=50)
+    object_id = models.PositiveBigIntegerField()
+    from_status = models.CharField(max_length=20)
+    to_status = models.CharField(max_length=20)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='status_changes'
+    )
+    note = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Status Change"
+        verbose_name_plural = "Status Changes"
+        indexes = [
+            models.Index(fields=['model_name', 'object_id']),
+            models.Index(fields=['created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} #{self.object_id}: {self.from_status} → {self.to_status}"
+
+
+class ApplicantTerm(models.Model):
+    """
+    Entry of the applicant full-text index: the weight of one term in one job
+    application or resume submission. Maintained by applicant_search.py.
+    """
+    model_name = models.CharField(max_length=50)
+    object_id = models.PositiveBigIntegerField()
+    term = models.CharField(max_length=50)
+    weight = models.FloatField()
+
+    class Meta:
+        verbose_name = "Applicant Term"
+        verbose_name_plural = "Applicant Terms"
+        indexes = [
+            models.Index(fields=['term', 'model_name']),
+            models.Index(fields=['model_name', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} #{self.object_id}: {self.term}"
+
+
+class RateLimitCounter(models.Model):
+    """
+    Sliding-window rate limit state for one client key.
+
+    Only the current and previous window counts are kept, so each key costs one
+    fixed-size row regardless of how many requests it makes.
+    """
+    key = models.CharField(max_length=200, unique=True)
+    window = models.BigIntegerField()
+    current = models.PositiveIntegerField(default=0)
+    previous = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.current}/{self.previous})"
@@ -0,0 +1,122 @@
+import heapq
+import re
+import threading
+from collections import Counter, defaultdict
+
+from django.db import connection
+from django.db.models import BooleanField, Case, FloatField, Func, IntegerField, Value, When
+from rest_framework import filters
+
+from .fragment_cache import get_model_version
+from .models import TeamMember
+
+
+# === Fuzzy People Search ===
+#
+# Matches ``?q=`` against TeamMember.search_text (name, position, department
+# and skills) by trigram similarity, so partial and misspelled names still
+# find their member. On Postgres this is pg_trgm's word similarity, answered
+# by a GIN index on search_text. Elsewhere an in-memory trigram index of the
+# active members stands in, rebuilt when the TeamMember version stamp
+# changes. Both rank members by how much of the query's trigrams they share.
+
+# Share of the query's trigrams a member must contain to match. Postgres uses
+# its own pg_trgm.word_similarity_threshold (0.6 by default) to pick rows.
+MIN_SIMILARITY = 0.5
+
+MAX_QUERY_LENGTH = 100
+
+# Best matches kept by the in-memory fallback; bounds the ORDER BY it builds
+MAX_RESULTS = 100
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def trigrams(text):
+    """Trigrams of each word, padded as pg_trgm pads them."""
+    grams = set()
+    for word in WORD_PATTERN.findall((text or '').lower()):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class WordSimilarity(Func):
+    function = 'word_similarity'
+    output_field = FloatField()
+
+
+class WordSimilar(Func):
+    """``query <% text``: the pg_trgm operator the GIN index answers."""
+    arg_joiner = ' <%% '
+    template = '(%(expressions)s)'
+    output_field = BooleanField()
+
+
+class TrigramIndex:
+    def __init__(self, members):
+        self.postings = defaultdict(list)
+        for pk, text in members:
+            for gram in trigrams(text):
+                self.postings[gram].append(pk)
+
+    def search(self, query, limit=MAX_RESULTS, min_similarity=MIN_SIMILARITY):
+        """The ``limit`` best [(pk, similarity), ...], touching only members sharing a trigram with ``query``."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        hits = Counter(pk for gram in grams for pk in self.postings.get(gram, ()))
+        scored = ((pk, count / len(grams)) for pk, count in hits.items())
+        return heapq.nlargest(
+            limit, ((pk, score) for pk, score in scored if score >= min_similarity), key=lambda item: item[1]
+        )
+
+
+_index = None
+_version = None
+_lock = threading.Lock()
+
+
+def get_index():
+    global _index, _version
+    version = get_model_version(TeamMember)
+    with _lock:
+        if _index is None or version != _version:
+            _index = TrigramIndex(TeamMember.objects.active().values_list('pk', 'search_text'))
+            _version = version
+        return _index
+
+
+def search_members(queryset, query):
+    """
+    ``queryset`` narrowed to the members matching ``query``, most similar
+    first. The in-memory fallback keeps only the MAX_RESULTS best matches.
+    """
+    query = ' '.join(query.split())[:MAX_QUERY_LENGTH]
+    if not trigrams(query):
+        return queryset.none()
+    if connection.vendor == 'postgresql':
+        return queryset.filter(WordSimilar(Value(query), 'search_text')).annotate(
+            similarity=WordSimilarity(Value(query), 'search_text')
+        ).order_by('-similarity', 'order', 'name')
+
+    ranked = [pk for pk, _ in get_index().search(query)]
+    if not ranked:
+        return queryset.none()
+    return queryset.filter(pk__in=ranked).order_by(
+        Case(*(When(pk=pk, then=Value(rank)) for rank, pk in enumerate(ranked)), output_field=IntegerField())
+    )
+
+
+class PeopleSearchFilter(filters.BaseFilterBackend):
+    """
+    Fuzzy ``?q=`` search on team members. Listed after OrderingFilter, since
+    results come back ranked by similarity.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').replace('\x00', '').strip()
+        if not query:
+            return queryset
+        return search_members(queryset, query)
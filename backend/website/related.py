@@ -0,0 +1,152 @@
+import random
+import re
+from collections import defaultdict
+
+from django.db import transaction
+
+
+# === Related Content Index ===
+#
+# Each Service and JobPosting stores a ranked list of neighbour ids in its
+# ``related_ids`` column. The lists are rebuilt whenever a row of that model is
+# saved or deleted, so detail pages only sample a few ids from a stored list
+# and fetch them by primary key.
+
+RELATED_INDEX_SIZE = 12
+
+# Detail pages pick at random among this many of the closest neighbours
+RELATED_SAMPLE_POOL = 6
+
+TAG_SPLIT_PATTERN = re.compile(r'[,;\n/|]+')
+WORD_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+
+# Words in free-text job requirements that say nothing about the role
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'experience', 'for', 'from', 'good', 'have',
+    'in', 'is', 'knowledge', 'of', 'on', 'or', 'plus', 'strong', 'the', 'to', 'understanding',
+    'with', 'work', 'working', 'years', 'you', 'your',
+}
+
+
+def normalize_tag(value):
+    """Lowercase, collapse whitespace and drop a trailing '.js' so 'React.js' and 'react' match."""
+    tag = ' '.join(str(value).lower().split())
+    if tag.endswith('.js') and len(tag) > 3:
+        tag = tag[:-3]
+    return tag
+
+
+def parse_tags(value):
+    """Split a comma-separated tag string such as ``Service.tech_stack``."""
+    return {tag for tag in (normalize_tag(part) for part in TAG_SPLIT_PATTERN.split(value or '')) if tag}
+
+
+def text_terms(value):
+    return {
+        normalize_tag(word.rstrip('.'))
+        for word in WORD_PATTERN.findall((value or '').lower())
+        if len(word) > 1 and word not in STOP_WORDS
+    }
+
+
+def service_tags(title, tech_stack):
+    return parse_tags(tech_stack) or text_terms(title)
+
+
+def job_tags(title, department, requirements):
+    tags = text_terms(title) | text_terms(requirements)
+    if department:
+        tags.add(f'department:{normalize_tag(department)}')
+    return tags
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def rank_neighbours(tagged, size=RELATED_INDEX_SIZE):
+    """
+    Rank neighbours for every item by Jaccard similarity of their tag sets.
+
+    ``tagged`` is a list of ``(pk, tags)`` pairs, newest first. Candidates are
+    found through an inverted tag index, so only items sharing a tag are
+    compared. Lists shorter than ``size`` are padded with the newest remaining
+    items so detail pages always have something to show.
+    """
+    by_tag = defaultdict(set)
+    for pk, tags in tagged:
+        for tag in tags:
+            by_tag[tag].add(pk)
+
+    tags_by_pk = dict(tagged)
+    recency = {pk: position for position, (pk, _) in enumerate(tagged)}
+    index = {}
+    for pk, tags in tagged:
+        candidates = set().union(*(by_tag[tag] for tag in tags)) - {pk} if tags else set()
+        scored = sorted(
+            candidates,
+            key=lambda other: (-jaccard(tags, tags_by_pk[other]), recency[other]),
+        )[:size]
+        if len(scored) < size:
+            chosen = set(scored) | {pk}
+            scored += [other for other, _ in tagged if other not in chosen][:size - len(scored)]
+        index[pk] = scored
+    return index
+
+
+def _tagged_rows(model):
+    from .models import JobPosting, Service
+
+    if model is Service:
+        rows = Service.objects.order_by('-created_at', '-pk').values_list('pk', 'title', 'tech_stack')
+        return [(pk, service_tags(title, tech_stack)) for pk, title, tech_stack in rows]
+    if model is JobPosting:
+        rows = JobPosting.objects.filter(is_active=True).order_by('-created_at', '-pk').values_list(
+            'pk', 'title', 'department', 'requirements'
+        )
+        return [(pk, job_tags(title, department, requirements)) for pk, title, department, requirements in rows]
+    raise ValueError(f"No related index for {model._meta.label}")
+
+
+def rebuild_related_index(model):
+    """
+    Recompute ``related_ids`` for every row of ``model``.
+
+    Only rows whose list actually changed are written, with one bulk UPDATE.
+    Returns the number of rows updated.
+    """
+    index = rank_neighbours(_tagged_rows(model))
+    changed = []
+    for obj in model.objects.only('pk', 'related_ids'):
+        related_ids = index.get(obj.pk, [])
+        if obj.related_ids != related_ids:
+            obj.related_ids = related_ids
+            changed.append(obj)
+    model.objects.bulk_update(changed, ['related_ids'], batch_size=500)
+    return len(changed)
+
+
+def schedule_rebuild(model):
+    """Rebuild ``model``'s index when the current transaction commits, at most once per commit."""
+    connection = transaction.get_connection()
+    if any(getattr(func, 'related_model', None) is model for _, func, _ in connection.run_on_commit):
+        return
+
+    def run():
+        rebuild_related_index(model)
+
+    run.related_model = model
+    transaction.on_commit(run)
+
+
+def related_objects(obj, count=3, queryset=None):
+    """Return up to ``count`` neighbours of ``obj`` sampled from its stored index."""
+    pool = (obj.related_ids or [])[:max(RELATED_SAMPLE_POOL, count)]
+    chosen = random.sample(pool, min(count, len(pool)))
+    if not chosen:
+        return []
+    queryset = queryset if queryset is not None else type(obj).objects.all()
+    found = queryset.in_bulk(chosen)
+    return [found[pk] for pk in chosen if pk in found]
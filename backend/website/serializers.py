@@ -122,9 +122,10 @@ class JobPostingSerializer(serializers.ModelSerializer):
             'id', 'title', 'slug', 'department', 'location', 'job_type',
             'description', 'requirements', 'requirements_list',
             'posted_date', 'salary_range', 'is_active', 'is_recent',
+            'application_count', 'recent_application_count',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['slug', 'created_at', 'updated_at']
+        read_only_fields = ['slug', 'application_count', 'recent_application_count', 'created_at', 'updated_at']
 
     def get_requirements_list(self, obj):
         return [r.strip() for r in obj.requirements.split('\n') if r.strip()] if obj.requirements else []
@@ -0,0 +1,68 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .applicant_search import reindex, remove_from_index, schedule_extraction
+from .fragment_cache import bump_model_version
+from .models import (
+    RECENT_APPLICATIONS_WINDOW, Candidate, JobApplication, JobPosting, ResumeSubmission, Service, Skill, TeamMember,
+    TeamMemberSkill,
+)
+from .related import schedule_rebuild
+from .skills import refresh_member_counts
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=JobPosting)
+@receiver(post_delete, sender=JobPosting)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_rendered_fragments(sender, **kwargs):
+    bump_model_version(sender)
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=JobPosting)
+@receiver(post_delete, sender=JobPosting)
+def refresh_related_index(sender, **kwargs):
+    schedule_rebuild(sender)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_save, sender=ResumeSubmission)
+def index_submission(sender, instance, created, **kwargs):
+    if created:
+        # Extraction indexes the new row once its resume text is in
+        schedule_extraction()
+    else:
+        reindex(sender, [instance.pk])
+
+
+@receiver(post_delete, sender=JobApplication)
+@receiver(post_delete, sender=ResumeSubmission)
+def unindex_submission(sender, instance, **kwargs):
+    remove_from_index(sender, instance.pk)
+
+
+@receiver(post_delete, sender=JobApplication)
+@receiver(post_delete, sender=ResumeSubmission)
+def uncount_candidate_submission(sender, instance, **kwargs):
+    Candidate.objects.uncount(instance.candidate_id, sender.candidate_counter)
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncount_application(sender, instance, **kwargs):
+    JobPosting.objects.adjust_application_counts(
+        instance.job_id,
+        total=-1,
+        new=-int(instance.status == 'new'),
+        recent=-int(instance.created_at >= timezone.now() - RECENT_APPLICATIONS_WINDOW),
+    )
+
+
+@receiver(post_delete, sender=TeamMember)
+def recount_skills(sender, **kwargs):
+    # The member's links are already gone, so recount every skill
+    refresh_member_counts(Skill, TeamMemberSkill)
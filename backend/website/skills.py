@@ -0,0 +1,53 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# === Team Skills ===
+#
+# TeamMember.skills stays the editable list; on save it is mirrored into
+# Skill rows linked through TeamMemberSkill, which the team directory filters
+# and facets on with indexed joins. Skill.member_count holds the number of
+# active members with the skill. The helpers take the model classes so the
+# data migration can pass its historical models.
+
+MAX_SKILL_LENGTH = 100
+
+
+def skill_key(name):
+    """Case- and whitespace-insensitive identity of a skill name."""
+    return ' '.join(str(name).split()).lower()[:MAX_SKILL_LENGTH]
+
+
+def clean_skills(skills):
+    """Distinct ``(key, name)`` pairs of a skills list, in order, ignoring non-strings and blanks."""
+    cleaned = {}
+    for skill in skills or []:
+        if isinstance(skill, str) and skill.strip():
+            cleaned.setdefault(skill_key(skill), ' '.join(skill.split())[:MAX_SKILL_LENGTH])
+    return list(cleaned.items())
+
+
+def link_skills(skill_model, link_model, member, skills):
+    """Replace the member's skill links with ``skills``; returns the ids of every skill touched."""
+    cleaned = clean_skills(skills)
+    keys = [key for key, _ in cleaned]
+    skill_model.objects.bulk_create(
+        [skill_model(key=key, name=name) for key, name in cleaned], ignore_conflicts=True
+    )
+    ids = dict(skill_model.objects.filter(key__in=keys).values_list('key', 'pk'))
+
+    previous = set(link_model.objects.filter(member=member).values_list('skill_id', flat=True))
+    link_model.objects.filter(member=member).delete()
+    link_model.objects.bulk_create([
+        link_model(member=member, skill_id=ids[key], position=position)
+        for position, key in enumerate(keys)
+    ])
+    return previous | set(ids.values())
+
+
+def refresh_member_counts(skill_model, link_model, skill_ids=None):
+    """Recompute member_count with one UPDATE, for ``skill_ids`` or for every skill."""
+    members = link_model.objects.filter(skill=OuterRef('pk'), member__is_active=True).order_by()
+    count = Coalesce(Subquery(members.values('skill').annotate(total=Count('pk')).values('total')), 0)
+    skills = skill_model.objects.all() if skill_ids is None else skill_model.objects.filter(pk__in=skill_ids)
+    return skills.update(member_count=count)
@@ -0,0 +1,95 @@
+import hashlib
+import re
+from collections import namedtuple
+
+from django.conf import settings
+from rest_framework import status
+
+from .fragment_cache import shared_cache
+from .throttling import SlidingWindowAnonRateThrottle
+
+
+# === Prefilter Settings ===
+
+# Hidden form field that humans never fill in
+HONEYPOT_FIELD = getattr(settings, 'SPAM_HONEYPOT_FIELD', 'website_url')
+
+# How long an identical (email, body, file) submission is treated as a duplicate
+DUPLICATE_WINDOW = getattr(settings, 'SPAM_DUPLICATE_WINDOW', 60 * 60 * 24)
+
+# Submissions with more links than this are treated as spam
+MAX_LINKS = getattr(settings, 'SPAM_MAX_LINKS', 3)
+
+LINK_PATTERN = re.compile(r'https?://|www\.', re.IGNORECASE)
+
+Rejection = namedtuple('Rejection', ['reason', 'status_code', 'message'])
+
+
+class SubmissionBurstThrottle(SlidingWindowAnonRateThrottle):
+    """Short-window limit shared by all public submission endpoints."""
+    scope = 'submission_burst'
+
+
+# === Fingerprints ===
+
+def _normalize(value):
+    return ' '.join(str(value or '').lower().split())
+
+
+def submission_fingerprint(kind, email, body='', upload=None):
+    """Cache key for a submission: its email, text and uploaded file's name and size."""
+    upload_key = f"{upload.name}|{upload.size}" if upload else ''
+    parts = f"{kind}|{_normalize(email)}|{_normalize(body)}|{_normalize(upload_key)}"
+    digest = hashlib.sha256(parts.encode('utf-8')).hexdigest()
+    return f"submission_fp:{digest[:32]}"
+
+
+def remember_submission(request):
+    """
+    Record an accepted submission so identical resubmissions are rejected.
+
+    Fingerprints live in the shared cache, so a resubmission is caught
+    whichever worker receives it.
+    """
+    fingerprint = getattr(request, 'submission_fingerprint', None)
+    if fingerprint:
+        shared_cache().set(fingerprint, 1, DUPLICATE_WINDOW)
+
+
+# === Prefilter ===
+
+def prefilter_submission(request, kind, body_field, scope_field=None, file_field=None):
+    """
+    Cheap checks run before serializer validation and any database write.
+
+    The per-IP burst limit runs first, before the request body is parsed.
+    Then the honeypot field, link stuffing and a cached fingerprint of the
+    email, ``body_field`` and uploaded ``file_field``. ``scope_field`` (e.g.
+    the job id) is folded into ``kind``, so the same person may apply to
+    different jobs. The fingerprint is left on the request for
+    remember_submission(). Returns a Rejection, or None if the submission
+    may proceed.
+    """
+    throttle = SubmissionBurstThrottle()
+    if not throttle.allow_request(request, None):
+        return Rejection('burst', status.HTTP_429_TOO_MANY_REQUESTS, 'Too many submissions. Please try again later.')
+
+    data = request.data
+
+    if data.get(HONEYPOT_FIELD):
+        return Rejection('honeypot', status.HTTP_400_BAD_REQUEST, 'Your submission could not be processed.')
+
+    body = data.get(body_field) or ''
+    if len(LINK_PATTERN.findall(str(body))) > MAX_LINKS:
+        return Rejection('links', status.HTTP_400_BAD_REQUEST, 'Your submission could not be processed.')
+
+    email = data.get('email')
+    upload = request.FILES.get(file_field) if file_field else None
+    if email and (body or upload):
+        if scope_field:
+            kind = f"{kind}:{data.get(scope_field)}"
+        request.submission_fingerprint = submission_fingerprint(kind, email, body, upload)
+        if shared_cache().get(request.submission_fingerprint):
+            return Rejection('duplicate', status.HTTP_409_CONFLICT, 'We have already received this submission.')
+
+    return None
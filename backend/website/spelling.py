@@ -0,0 +1,218 @@
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+
+from rest_framework import filters
+
+from .fragment_cache import get_model_version_map
+from .models import JobPosting, Service, Skill, TeamMember
+
+logger = logging.getLogger(__name__)
+
+
+# === Spelling Correction ===
+#
+# Symmetric-delete dictionary (as in SymSpell) over the catalog vocabulary.
+# Every vocabulary word is stored under each string reachable from it by
+# deleting up to MAX_EDIT_DISTANCE characters. A query word is corrected by
+# generating its own deletes and looking them up: the candidates are exactly
+# the words within that edit distance. The cost of a lookup depends on the
+# length of the word, not on the size of the vocabulary.
+
+MAX_EDIT_DISTANCE = 2
+
+# Edits allowed for a word of up to this many characters; longer words get
+# MAX_EDIT_DISTANCE. Short words are mostly acronyms ('aws', 'gcp') that are
+# only a couple of edits from unrelated ones, so they are never rewritten.
+EDIT_DISTANCE_BY_LENGTH = ((3, 0), (5, 1))
+
+# Only the first characters of a word take part in deletes; this keeps the
+# dictionary small while long words still correct well on their prefix
+PREFIX_LENGTH = 7
+
+MIN_WORD_LENGTH = 3
+
+WORD_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+
+def tokenize(text):
+    return WORD_PATTERN.findall((text or '').lower())
+
+
+def _deletes(word, max_distance=MAX_EDIT_DISTANCE):
+    deletes = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1:]
+            for candidate in frontier if len(candidate) > 1
+            for i in range(len(candidate))
+        }
+        deletes |= frontier
+    return deletes
+
+
+def allowed_distance(word):
+    for length, distance in EDIT_DISTANCE_BY_LENGTH:
+        if len(word) <= length:
+            return distance
+    return MAX_EDIT_DISTANCE
+
+
+def edit_distance(a, b, limit=MAX_EDIT_DISTANCE):
+    """Optimal string alignment distance (adjacent swaps count as one edit)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SpellingDictionary:
+    def __init__(self, frequencies):
+        self.frequencies = frequencies
+        self.deletes = defaultdict(set)
+        for word in frequencies:
+            for delete in _deletes(word[:PREFIX_LENGTH]):
+                self.deletes[delete].add(word)
+
+    def correct(self, word):
+        """Best vocabulary word within the allowed distance for its length, or None."""
+        if word in self.frequencies:
+            return word
+        max_distance = allowed_distance(word)
+        if len(word) < MIN_WORD_LENGTH or not max_distance:
+            return None
+        candidates = set()
+        for delete in _deletes(word[:PREFIX_LENGTH], max_distance):
+            candidates |= self.deletes.get(delete, set())
+        best = None
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, max_distance)
+            if distance > max_distance:
+                continue
+            rank = (distance, -self.frequencies[candidate], candidate)
+            if best is None or rank < best:
+                best = rank
+        return best[2] if best else None
+
+
+def catalog_vocabulary():
+    """
+    Word frequencies over every field the service and job searches match.
+
+    Descriptions, departments and locations are included too, so a word that
+    does match something is never "corrected" away.
+    """
+    counts = Counter()
+    for row in Service.objects.values_list('title', 'tech_stack', 'description'):
+        for text in row:
+            counts.update(tokenize(text))
+    for row in JobPosting.objects.active().values_list('title', 'requirements', 'description', 'department', 'location'):
+        for text in row:
+            counts.update(tokenize(text))
+    for skill, members in Skill.objects.filter(member_count__gt=0).values_list('name', 'member_count'):
+        for word in tokenize(skill):
+            counts[word] += members
+    return {word: count for word, count in counts.items() if len(word) >= MIN_WORD_LENGTH}
+
+
+# === Shared Dictionary ===
+
+SOURCES = (Service, JobPosting, TeamMember)
+
+_dictionary = None
+_version = None
+_rebuilding = False
+_lock = threading.Lock()
+
+
+def _rebuild(version):
+    global _dictionary, _version, _rebuilding
+    try:
+        dictionary = SpellingDictionary(catalog_vocabulary())
+        with _lock:
+            _dictionary, _version = dictionary, version
+    except Exception as e:
+        logger.error(f"Spelling dictionary rebuild failed: {str(e)}")
+    finally:
+        with _lock:
+            _rebuilding = False
+        # Background threads must not leave their database connection open
+        from django.db import connections
+        connections.close_all()
+
+
+def get_dictionary():
+    """
+    Current dictionary for this process.
+
+    The first call builds it inline. When the catalog version stamps change,
+    the old dictionary keeps answering while a background thread builds the
+    new one.
+    """
+    global _dictionary, _version, _rebuilding
+    version = tuple(get_model_version_map(*SOURCES).values())
+    if _dictionary is None:
+        with _lock:
+            if _dictionary is None:
+                _dictionary, _version = SpellingDictionary(catalog_vocabulary()), version
+        return _dictionary
+    if version != _version:
+        with _lock:
+            start = not _rebuilding
+            _rebuilding = True
+        if start:
+            threading.Thread(target=_rebuild, args=(version,), daemon=True).start()
+    return _dictionary
+
+
+def correct_query(query):
+    """
+    Rewrite each unknown word of ``query`` to its best correction.
+
+    Returns ``(corrected_query, changed)``. Words with no close match are left
+    as typed.
+    """
+    dictionary = get_dictionary()
+    words = (query or '').split()
+    corrected = []
+    for word in words:
+        key = word.lower()
+        correction = dictionary.correct(key) if WORD_PATTERN.fullmatch(key) else None
+        corrected.append(correction if correction and correction != key else word)
+    corrected_query = ' '.join(corrected)
+    return corrected_query, corrected_query != ' '.join(words)
+
+
+# === Search Filter ===
+
+class TypoTolerantSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter that searches for the corrected query.
+
+    The correction is left on ``request.search_correction`` (None when the
+    query was already spelled right) so list views can offer it as a hint.
+    """
+
+    def get_search_terms(self, request):
+        params = request.query_params.get(self.search_param, '')
+        corrected, changed = correct_query(params.replace('\x00', '').replace(',', ' '))
+        request.search_correction = corrected if changed else None
+        return corrected.split()
+
+
+def add_correction_hint(request, response):
+    """Add ``did_you_mean`` to a list response when the search was corrected."""
+    correction = getattr(request, 'search_correction', None)
+    if correction and isinstance(response.data, dict):
+        response.data['did_you_mean'] = correction
+    return response
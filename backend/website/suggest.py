@@ -0,0 +1,129 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+
+from django.conf import settings
+
+from .fragment_cache import get_model_version_map
+from .models import JobPosting, Service, Skill, TeamMember
+
+
+# === Autocomplete Index ===
+#
+# Every suggestion is stored under its full lowercase text and under each
+# later word in it ("backend engineer" is also found by "eng"), in one
+# sorted array per source model. A lookup is a binary search for the prefix
+# followed by a short forward scan, all in process memory.
+#
+# Each worker keeps its own copy. At most every VERSION_CHECK_INTERVAL
+# seconds it reads the version stamps of the source models (bumped on every
+# save/delete, see signals.py) in one cache call, so keystrokes in between
+# never leave the process. Only the sources whose stamp changed are reloaded
+# from the database; an edit shows up within that interval.
+
+MAX_SUGGESTIONS = 20
+
+VERSION_CHECK_INTERVAL = getattr(settings, 'SUGGEST_VERSION_CHECK_INTERVAL', 5)
+
+Suggestion = namedtuple('Suggestion', ['text', 'type', 'slug'])
+
+
+def _keys(text):
+    words = text.lower().split()
+    return [' '.join(words[i:]) for i in range(len(words))]
+
+
+def _entries(suggestions):
+    entries = {}
+    for suggestion in suggestions:
+        for key in _keys(suggestion.text):
+            entries.setdefault((key, suggestion.type, suggestion.text), suggestion)
+    return sorted(entries.items())
+
+
+def _service_suggestions():
+    suggestions = []
+    for title, slug, tech_stack in Service.objects.values_list('title', 'slug', 'tech_stack'):
+        suggestions.append(Suggestion(title, 'service', slug))
+        for tech in (tech_stack or '').split(','):
+            if tech.strip():
+                suggestions.append(Suggestion(tech.strip(), 'tech', None))
+    return suggestions
+
+
+def _job_suggestions():
+    suggestions = []
+    for title, slug, department in JobPosting.objects.active().values_list('title', 'slug', 'department'):
+        suggestions.append(Suggestion(title, 'job', slug))
+        if department:
+            suggestions.append(Suggestion(department, 'department', None))
+    return suggestions
+
+
+def _team_suggestions():
+    return [
+        Suggestion(skill, 'skill', None)
+        for skill in Skill.objects.filter(member_count__gt=0).values_list('name', flat=True)
+    ]
+
+
+SOURCES = {
+    Service: _service_suggestions,
+    JobPosting: _job_suggestions,
+    TeamMember: _team_suggestions,
+}
+
+
+class SuggestIndex:
+    def __init__(self, sources=SOURCES):
+        self.sources = sources
+        self.versions = {}
+        self.arrays = {}
+        self.checked_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self, interval=VERSION_CHECK_INTERVAL):
+        """Reload the sources whose version stamp moved, checking at most every ``interval`` seconds."""
+        now = time.monotonic()
+        if self.checked_at is not None and now - self.checked_at < interval:
+            return
+        self.checked_at = now
+        current = get_model_version_map(*self.sources)
+        stale = [model for model, version in current.items() if self.versions.get(model) != version]
+        if not stale:
+            return
+        with self._lock:
+            for model in stale:
+                if self.versions.get(model) == current[model]:
+                    continue
+                entries = _entries(self.sources[model]())
+                # Swap in a new (keys, values) pair so readers never see a half-built array
+                self.arrays[model] = ([key for key, _ in entries], [value for _, value in entries])
+                self.versions[model] = current[model]
+
+    def lookup(self, prefix, limit=10):
+        prefix = ' '.join(prefix.lower().split())
+        if not prefix:
+            return []
+        seen = set()
+        matches = []
+        for keys, values in list(self.arrays.values()):
+            position = bisect_left(keys, (prefix,))
+            while position < len(keys) and keys[position][0].startswith(prefix):
+                suggestion = values[position]
+                if (suggestion.type, suggestion.text.lower()) not in seen:
+                    seen.add((suggestion.type, suggestion.text.lower()))
+                    # Whole-text matches rank before matches on a later word
+                    matches.append((keys[position][0] != suggestion.text.lower(), len(suggestion.text), suggestion))
+                position += 1
+        matches.sort(key=lambda match: (match[0], match[1], match[2].text.lower()))
+        return [suggestion for _, _, suggestion in matches[:limit]]
+
+
+_index = SuggestIndex()
+
+
+def suggest(prefix, limit=10):
+    _index.refresh()
+    return _index.lookup(prefix, min(limit, MAX_SUGGESTIONS))
@@ -0,0 +1,45 @@
+from django.core.cache import cache
+
+from .fragment_cache import get_model_version
+from .models import Skill, TeamMember
+
+
+# === Cached Team Queries ===
+#
+# Team pages and endpoints read members through these helpers. Results are
+# cached under the TeamMember version stamp, so any save or delete makes the
+# next call hit the database again.
+
+TEAM_CACHE_TIMEOUT = 60 * 60
+
+LEADERSHIP_LIMIT = 8
+HIGHLIGHTS_LIMIT = 4
+
+
+def _cached(name, build):
+    key = f"team:{name}:{get_model_version(TeamMember)}"
+    members = cache.get(key)
+    if members is None:
+        members = build()
+        cache.set(key, members, TEAM_CACHE_TIMEOUT)
+    return members
+
+
+def get_active_members():
+    return _cached('active', lambda: list(TeamMember.objects.ordered().with_skills()))
+
+
+def get_leadership(limit=LEADERSHIP_LIMIT):
+    return _cached(f'leadership:{limit}', lambda: list(TeamMember.objects.leadership().with_skills()[:limit]))
+
+
+def get_highlights(limit=HIGHLIGHTS_LIMIT):
+    """Leadership first, then the most senior and experienced members, in a single query."""
+    return _cached(f'highlights:{limit}', lambda: list(TeamMember.objects.highlights().with_skills()[:limit]))
+
+
+def get_skill_facets():
+    """Every skill held by an active member, most common first, with its member count."""
+    return _cached('skills', lambda: list(
+        Skill.objects.filter(member_count__gt=0).order_by('-member_count', 'name').values('name', 'member_count')
+    ))
@@ -0,0 +1,17 @@
+from django import template
+
+from website.fragment_cache import get_model_versions
+
+register = template.Library()
+
+@register.simple_tag
+def model_version(*labels):
+    """
+    Template tag returning the current version stamp for one or more models.
+
+    Usage in templates:
+    {% load cache cache_tags %}
+    {% model_version 'website.TeamMember' as team_version %}
+    {% cache 3600 team_grid team_version %}...{% endcache %}
+    """
+    return get_model_versions(*labels)
@@ -0,0 +1,186 @@
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, Value, When
+from django.utils.module_loading import import_string
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+
+# === Counter Stores ===
+
+class DatabaseCounterStore:
+    """
+    Counter store backed by the RateLimitCounter table.
+
+    Every operation is a single conditional UPDATE (plus an INSERT the first
+    time a key is seen), so increments are atomic across all workers that share
+    the database.
+    """
+
+    def hit(self, key, window, duration):
+        from .models import RateLimitCounter
+
+        expires_at = datetime.fromtimestamp((window + 2) * duration, tz=dt_timezone.utc)
+        counters = RateLimitCounter.objects.filter(key=key)
+
+        with transaction.atomic():
+            # Roll a stale row forward: the old current count becomes the
+            # previous window only if it is exactly one window behind.
+            updated = counters.filter(window__lt=window).update(
+                previous=Case(When(window=window - 1, then=F('current')), default=Value(0)),
+                current=1,
+                window=window,
+                expires_at=expires_at,
+            )
+            if not updated:
+                updated = counters.filter(window=window).update(current=F('current') + 1)
+            if not updated:
+                try:
+                    with transaction.atomic():
+                        RateLimitCounter.objects.create(
+                            key=key, window=window, current=1, previous=0, expires_at=expires_at
+                        )
+                except IntegrityError:
+                    counters.filter(window=window).update(current=F('current') + 1)
+            return counters.values_list('current', 'previous').get()
+
+    def release(self, key, window):
+        from .models import RateLimitCounter
+
+        RateLimitCounter.objects.filter(key=key, window=window, current__gt=0).update(
+            current=F('current') - 1
+        )
+
+    def prune(self, now=None):
+        from .models import RateLimitCounter
+
+        now = now or datetime.now(tz=dt_timezone.utc)
+        return RateLimitCounter.objects.filter(expires_at__lt=now).delete()[0]
+
+
+class LocalCounterStore:
+    """
+    In-process counter store with the same interface as DatabaseCounterStore.
+
+    Limits are per process, so this is only meant for tests and local development.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key, window, duration):
+        with self._lock:
+            last_window, current, previous, _ = self._counters.get(key, (window, 0, 0, 0))
+            if last_window < window:
+                previous = current if last_window == window - 1 else 0
+                current = 0
+            current += 1
+            self._counters[key] = (window, current, previous, (window + 2) * duration)
+            return current, previous
+
+    def release(self, key, window):
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry and entry[0] == window and entry[1]:
+                self._counters[key] = (entry[0], entry[1] - 1, entry[2], entry[3])
+
+    def prune(self, now=None):
+        now = (now or datetime.now(tz=dt_timezone.utc)).timestamp()
+        with self._lock:
+            stale = [key for key, entry in self._counters.items() if entry[3] < now]
+            for key in stale:
+                del self._counters[key]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_counter_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = getattr(settings, 'RATE_LIMIT_STORE', 'website.throttling.DatabaseCounterStore')
+                _store = import_string(path)()
+    return _store
+
+
+def _reset_counter_store(setting, **kwargs):
+    global _store
+    if setting == 'RATE_LIMIT_STORE':
+        _store = None
+
+
+setting_changed.connect(_reset_counter_store)
+
+
+# === Throttles ===
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Throttle using a sliding-window counter instead of DRF's timestamp history.
+
+    The request rate is estimated as
+        previous_window_count * (1 - elapsed / duration) + current_window_count
+    which needs two integers per client, checked and incremented in one atomic
+    store operation.
+    """
+    timer = time.time
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        self.window = int(self.now // self.duration)
+        self.elapsed = self.now - self.window * self.duration
+
+        store = get_counter_store()
+        current, previous = store.hit(self.key, self.window, self.duration)
+        self.previous = previous
+
+        if self._estimate(current, previous) <= self.num_requests:
+            self.current = current
+            return True
+
+        # Rejected requests do not count towards the limit
+        store.release(self.key, self.window)
+        self.current = current - 1
+        return self.throttle_failure()
+
+    def _estimate(self, current, previous):
+        return previous * (1 - self.elapsed / self.duration) + current
+
+    def wait(self):
+        """Seconds until one more request would fit under the limit."""
+        headroom = self.num_requests - self.current - 1
+        if headroom >= 0 and self.previous:
+            needed = self.duration * (1 - headroom / self.previous)
+            return max(needed - self.elapsed, 0)
+        if headroom >= 0:
+            return 0
+        remaining = self.duration - self.elapsed
+        return remaining + self.duration * max(1 - (self.num_requests - 1) / self.current, 0)
+
+
+class SlidingWindowAnonRateThrottle(SlidingWindowRateThrottle, AnonRateThrottle):
+    scope = 'anon'
+
+
+class SlidingWindowUserRateThrottle(SlidingWindowRateThrottle, UserRateThrottle):
+    scope = 'user'
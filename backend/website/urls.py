@@ -1,6 +1,7 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views, api_views, api_proxy
+from . import views, api_views, api_proxy, async_views
 
 # API Router for DRF ViewSets
 router = DefaultRouter()
@@ -11,6 +12,20 @@ router.register(r'jobs', api_views.JobPostingViewSet, basename='job')
 # App name for namespacing
 app_name = 'website'
 
+
+def io_view(sync_view, async_view):
+    """Pick the async variant of an I/O-bound endpoint when running under ASGI."""
+    return async_view if settings.USE_ASYNC_VIEWS else sync_view
+
+
+# Async versions of read-only router actions, matched ahead of the router under ASGI
+async_read_urls = [
+    path('api/jobs/recent/', async_views.recent_jobs, name='job-recent'),
+    path('api/jobs/departments/', async_views.job_departments, name='job-departments'),
+    path('api/jobs/locations/', async_views.job_locations, name='job-locations'),
+] if settings.USE_ASYNC_VIEWS else []
+
+
 urlpatterns = [
     # Traditional Django views (for server-rendered pages)
     path('', views.HomeView.as_view(), name='home'),
@@ -22,14 +37,17 @@ urlpatterns = [
     path('contact/', views.ContactView.as_view(), name='contact'),
     
     # API endpoints - Core ViewSets
+    *async_read_urls,
     path('api/', include(router.urls)),
     
     # Enhanced API endpoints for modern frontend integration
     path('api/contact/', api_views.contact_submission, name='api_contact'),
     path('api/contact/resume/', api_views.resume_submission, name='api_resume'),
     path('api/jobs/apply/', api_views.job_application, name='api_job_application'),
-    path('api/health/', api_views.health_check, name='api_health'),
+    path('api/health/', io_view(api_views.health_check, async_views.health_check), name='api_health'),
     path('api/homepage/', api_views.homepage_data, name='api_homepage'),
+    path('api/batch/', api_views.batch_resources, name='api_batch'),
+    path('api/suggest/', api_views.suggestions, name='api_suggest'),
     
     # Featured content endpoints
     path('api/services/featured/', api_views.featured_services, name='api_featured_services'),
@@ -42,8 +60,15 @@ urlpatterns = [
     path('api/jobs/departments/', api_views.job_departments, name='api_job_departments'),
     path('api/jobs/locations/', api_views.job_locations, name='api_job_locations'),
     
+    # Recruiter exports (staff only)
+    path('api/exports/<slug:kind>/', api_views.export_submissions, name='api_export_submissions'),
+    path('api/submissions/status/', api_views.bulk_status_update, name='api_bulk_status_update'),
+    path('api/submissions/search/', api_views.search_submissions, name='api_search_submissions'),
+    path('api/candidates/', api_views.candidate_activity, name='api_candidate_activity'),
+    path('api/analytics/submissions/', api_views.submission_analytics, name='api_submission_analytics'),
+    
     # API proxy endpoints for secure third-party API access
-    path('api/proxy/gemini/', api_proxy.gemini_api_proxy, name='gemini_api_proxy'),
+    path('api/proxy/gemini/', io_view(api_proxy.gemini_api_proxy, async_views.gemini_api_proxy), name='gemini_api_proxy'),
     
     # Legacy function-based view redirects (for backward compatibility)
     path('home/', views.home, name='home_legacy'),
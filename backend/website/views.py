@@ -11,23 +11,24 @@ import logging
 
 from .models import Service, JobPosting, TeamMember, ContactMessage
 from .forms import ContactForm
+from .related import related_objects
+from .team import get_active_members
+from .job_search import search_jobs
 
 logger = logging.getLogger(__name__)
 
 
 class HomeView(TemplateView):
+    # Not wrapped in cache_page: the page shell carries a per-request CSP nonce.
+    # Expensive data is cached at the fragment and statistics level instead.
     template_name = 'website/home.html'
 
-    @method_decorator(cache_page(60 * 15))
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
             context.update({
                 'featured_services': Service.objects.order_by('-created_at')[:3],
-                'team_members': TeamMember.objects.active().ordered()[:4],
+                'team_members': get_active_members()[:4],
                 'recent_jobs': JobPosting.objects.active().order_by('-created_at')[:3],
                 'stats': self._get_homepage_statistics(),
                 'page_title': 'Welcome to AZAYD - Digital Innovation Hub',
@@ -49,12 +50,13 @@ class HomeView(TemplateView):
         stats = cache.get(cache_key)
         if stats is None:
             try:
+                service_count = Service.objects.count()
                 stats = {
                     'projects_completed': 100,
-                    'happy_clients': Service.objects.count() * 10,
+                    'happy_clients': service_count * 10,
                     'years_experience': 5,
-                    'team_members': TeamMember.objects.active().count(),
-                    'active_services': Service.objects.count(),
+                    'team_members': len(get_active_members()),
+                    'active_services': service_count,
                     'open_positions': JobPosting.objects.active().count(),
                 }
                 cache.set(cache_key, stats, 60 * 60)
@@ -99,9 +101,7 @@ class ServiceDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['related_services'] = Service.objects.exclude(
-            id=self.object.id
-        ).order_by('?')[:3]
+        context['related_services'] = related_objects(self.object)
         return context
 
 
@@ -110,7 +110,7 @@ class AboutView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['team_members'] = TeamMember.objects.active().ordered()
+        context['team_members'] = get_active_members()
         return context
 
 
@@ -121,20 +121,16 @@ class CareerListView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = JobPosting.objects.active().order_by('-created_at')
-        department = self.request.GET.get('department')
-        location = self.request.GET.get('location')
-        if department:
-            queryset = queryset.filter(department__icontains=department)
-        if location:
-            queryset = queryset.filter(location__icontains=location)
+        queryset, self.facets, self.search_correction = search_jobs(self.request.GET)
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context.update({
-            'departments': JobPosting.objects.active().values_list('department', flat=True).distinct(),
-            'locations': JobPosting.objects.active().values_list('location', flat=True).distinct(),
+            'facets': self.facets,
+            'did_you_mean': self.search_correction,
+            'departments': [facet['value'] for facet in self.facets['department']],
+            'locations': [facet['value'] for facet in self.facets['location']],
         })
         return context
 
@@ -149,9 +145,7 @@ class JobDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['related_jobs'] = JobPosting.objects.active().filter(
-            department=self.object.department
-        ).exclude(id=self.object.id)[:3]
+        context['related_jobs'] = related_objects(self.object, queryset=self.get_queryset())
         return context
 
 
@@ -0,0 +1,80 @@
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.template import TemplateSyntaxError, engines
+
+logger = logging.getLogger(__name__)
+
+
+# === Worker Warm-up ===
+
+def iter_project_templates(engine):
+    """Yield the name of every file under the engine's DIRS, relative to its directory."""
+    for directory in engine.dirs:
+        root = Path(directory)
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob('*')):
+            if path.is_file() and not path.name.startswith('.'):
+                yield path.relative_to(root).as_posix()
+
+
+def warm_templates(using='django'):
+    """
+    Parse every project template once so it lands in the cached loader.
+
+    Run at worker boot; afterwards the first request for a page neither scans
+    the filesystem nor compiles the template. Broken templates are logged and
+    skipped so they fail on use, exactly as they would without warm-up.
+    Returns the number of templates compiled.
+    """
+    engine = engines[using].engine
+    started = time.monotonic()
+    compiled = 0
+    for name in iter_project_templates(engine):
+        try:
+            engine.get_template(name)
+            compiled += 1
+        except (TemplateSyntaxError, UnicodeDecodeError) as e:
+            logger.warning(f"Template warm-up skipped {name}: {e}")
+    logger.info(f"Warmed {compiled} templates in {(time.monotonic() - started) * 1000:.0f}ms")
+    return compiled
+
+
+def warm_database_connections():
+    """
+    Open (and health-check) a connection to every configured database.
+
+    With persistent connections (CONN_MAX_AGE) the connection opened here is
+    reused by the first request this thread serves, so TCP/TLS setup and
+    authentication happen before traffic arrives. Failures are logged only;
+    requests will retry the connection as usual. Aliases without an ENGINE
+    (no DATABASE_URL) and the direct export alias are skipped. Returns the
+    aliases warmed.
+    """
+    if not getattr(settings, 'DB_WARM_CONNECTIONS', True):
+        return []
+    direct_alias = getattr(settings, 'DATABASE_DIRECT_ALIAS', DEFAULT_DB_ALIAS)
+    warmed = []
+    for alias in connections:
+        if alias != DEFAULT_DB_ALIAS and alias == direct_alias:
+            continue
+        connection = connections[alias]
+        if connection.vendor == 'unknown':
+            # Dummy backend: DATABASES has no ENGINE for this alias
+            continue
+        started = time.monotonic()
+        try:
+            connection.ensure_connection()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+        except Exception as e:
+            # Never fail worker boot; requests retry the connection themselves
+            logger.warning(f"Could not warm database connection '{alias}': {e}")
+            continue
+        warmed.append(alias)
+        logger.info(f"Warmed database connection '{alias}' in {(time.monotonic() - started) * 1000:.0f}ms")
+    return warmed
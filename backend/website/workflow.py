@@ -0,0 +1,114 @@
+from collections import Counter
+
+from django.db import transaction
+
+from .models import Candidate, JobApplication, JobPosting, ResumeSubmission, StatusChange, SubmissionRollup
+
+
+# === Review Workflow ===
+
+SUBMISSION_MODELS = {
+    'applications': JobApplication,
+    'resumes': ResumeSubmission,
+}
+
+# Forward moves allowed by the API. Admin actions may override these.
+STATUS_TRANSITIONS = {
+    'new': {'reviewing', 'contacted', 'rejected'},
+    'reviewing': {'contacted', 'interview', 'rejected'},
+    'contacted': {'reviewing', 'interview', 'rejected'},
+    'interview': {'hired', 'rejected'},
+    'rejected': {'reviewing'},
+    'hired': set(),
+}
+
+MAX_BATCH_SIZE = 1000
+
+
+class WorkflowError(ValueError):
+    """Raised when a status transition request is invalid."""
+
+
+def allowed_sources(target):
+    return {source for source, targets in STATUS_TRANSITIONS.items() if target in targets}
+
+
+def transition_status(queryset, target, user=None, note='', enforce_workflow=True):
+    """
+    Move every row in ``queryset`` to ``target`` with a single UPDATE.
+
+    Current statuses are read under a row lock so the audit trail records the
+    true previous value, then one UPDATE and one bulk INSERT are issued inside
+    the same transaction, with one more UPDATE for the candidates' latest
+    status, one per (job, source) group for the daily rollups and, for
+    applications, one per job whose unreviewed count changed. Rows that are
+    already at ``target``, or that cannot reach it under the workflow, are
+    left untouched.
+
+    Returns a dict with the ``updated`` and ``skipped`` primary keys.
+    """
+    model = queryset.model
+    valid_statuses = {choice for choice, _ in model._meta.get_field('status').choices}
+    if target not in valid_statuses:
+        raise WorkflowError(f"Invalid status '{target}'.")
+
+    sources = allowed_sources(target) if enforce_workflow else valid_statuses - {target}
+
+    job_fields = ['job_id'] if model is JobApplication else []
+
+    with transaction.atomic():
+        rows = queryset.order_by().select_for_update().values_list('pk', 'status', 'source', *job_fields)
+        current = {}
+        rollup_keys = {}
+        for pk, status, source, *job in rows:
+            current[pk] = status
+            rollup_keys[pk] = (job[0] if job else None, source)
+        updated = [pk for pk, status in current.items() if status in sources]
+        skipped = [pk for pk, status in current.items() if status not in sources]
+
+        if updated:
+            model.objects.filter(pk__in=updated).update(
+                status=target, is_reviewed=target != 'new'
+            )
+            StatusChange.objects.bulk_create([
+                StatusChange(
+                    model_name=model._meta.model_name,
+                    object_id=pk,
+                    from_status=current[pk],
+                    to_status=target,
+                    changed_by=user if user and user.is_authenticated else None,
+                    note=note,
+                )
+                for pk in updated
+            ])
+            Candidate.objects.record_activity(
+                model.objects.filter(pk__in=updated, candidate__isnull=False).values('candidate_id'), target
+            )
+            SubmissionRollup.objects.record(model, target, [rollup_keys[pk] for pk in updated])
+            if model is JobApplication:
+                new_deltas = Counter()
+                for pk in updated:
+                    new_deltas[rollup_keys[pk][0]] += int(target == 'new') - int(current[pk] == 'new')
+                for job_id, delta in new_deltas.items():
+                    JobPosting.objects.adjust_application_counts(job_id, new=delta)
+
+    return {'updated': updated, 'skipped': skipped}
+
+
+def transition_by_ids(kind, ids, target, user=None, note=''):
+    """Validate an API batch request and apply it through ``transition_status``."""
+    model = SUBMISSION_MODELS.get(kind)
+    if model is None:
+        raise WorkflowError(f"Unknown submission type '{kind}'. Choose from: {', '.join(SUBMISSION_MODELS)}.")
+    if not isinstance(ids, list) or not ids:
+        raise WorkflowError("Provide a non-empty list of ids.")
+    if len(ids) > MAX_BATCH_SIZE:
+        raise WorkflowError(f"At most {MAX_BATCH_SIZE} ids can be changed per request.")
+    try:
+        ids = {int(pk) for pk in ids}
+    except (TypeError, ValueError):
+        raise WorkflowError("Ids must be integers.")
+
+    result = transition_status(model.objects.filter(pk__in=ids), target, user=user, note=note)
+    result['missing'] = sorted(ids - set(result['updated']) - set(result['skipped']))
+    return result
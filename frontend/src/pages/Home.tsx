@@ -155,25 +155,10 @@ const Home: React.FC = () => {
       setIsLoading(true);
       setError(null);
       
-      // Fetch data in parallel for better performance
-      const [servicesResponse, teamResponse] = await Promise.allSettled([
-        apiService.getFeaturedServices(),
-        apiService.getTeamHighlights()
-      ]);
-      
-      // Handle services data
-      if (servicesResponse.status === 'fulfilled') {
-        setFeaturedServices(servicesResponse.value);
-      } else {
-        console.warn('Failed to fetch featured services:', servicesResponse.reason);
-      }
-      
-      // Handle team data
-      if (teamResponse.status === 'fulfilled') {
-        setTeamHighlights(teamResponse.value);
-      } else {
-        console.warn('Failed to fetch team highlights:', teamResponse.reason);
-      }
+      // Featured services and team highlights arrive in a single batch request
+      const { featuredServices: services, teamHighlights: team } = await apiService.getInitialLoadData();
+      setFeaturedServices(services);
+      setTeamHighlights(team);
       
       // Set mock homepage data structure
       setHomeData({
@@ -194,8 +179,8 @@ const Home: React.FC = () => {
             response_time_hours: 24
           }
         },
-        featured_services: servicesResponse.status === 'fulfilled' ? servicesResponse.value : [],
-        team_highlights: teamResponse.status === 'fulfilled' ? teamResponse.value : [],
+        featured_services: services,
+        team_highlights: team,
         recent_projects: [],
         testimonials: [],
         company_stats: {
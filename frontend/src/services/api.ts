@@ -796,6 +796,52 @@ export const apiService = {
       console.error('Error checking health:', error);
       return { status: 'error', timestamp: new Date().toISOString() };
     }
+  },
+
+  // Batch - fetch several read-only endpoints in a single round-trip
+  getBatch: async (paths: string[]): Promise<Record<string, { status: number; data: any }>> => {
+    const response = await api.get('/api/batch/', {
+      params: { path: paths },
+      paramsSerializer: { indexes: null }
+    });
+    return response.data.responses || {};
+  },
+
+  // Initial load - everything the home page needs on first paint, in one
+  // round-trip. Any part the batch could not serve is fetched on its own.
+  getInitialLoadData: async (): Promise<{ featuredServices: Service[]; teamHighlights: TeamMember[] }> => {
+    if (USE_MOCK_DATA) {
+      const [featuredServices, teamHighlights] = await Promise.all([
+        apiService.getFeaturedServices(),
+        apiService.getTeamHighlights()
+      ]);
+      return { featuredServices, teamHighlights };
+    }
+    let responses: Record<string, { status: number; data: any }> = {};
+    try {
+      responses = await apiService.getBatch(['/api/services/featured/', '/api/team/highlights/']);
+    } catch (error) {
+      console.error('Error fetching initial load data:', error);
+    }
+    // Payload key holding each endpoint's list: services/featured answers
+    // {status, data, count}, team/highlights {status, count, results}
+    const list = (path: string, key: 'data' | 'results'): any[] | null => {
+      const entry = responses[path];
+      if (!entry || entry.status !== 200 || !entry.data) {
+        return null;
+      }
+      const data = entry.data[key];
+      if (!Array.isArray(data)) {
+        console.error(`Unexpected batch payload for ${path}, expected a "${key}" list:`, entry.data);
+        return null;
+      }
+      return data;
+    };
+    const [featuredServices, teamHighlights] = await Promise.all([
+      list('/api/services/featured/', 'data') || apiService.getFeaturedServices(),
+      list('/api/team/highlights/', 'results') || apiService.getTeamHighlights()
+    ]);
+    return { featuredServices, teamHighlights };
   }
 };
 
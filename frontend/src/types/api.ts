@@ -89,6 +89,8 @@ export interface JobPosting {
   is_active: boolean;
   tags: string[];
   slug: string;
+  application_count?: number;
+  recent_application_count?: number;
 }
 
 // Contact Message Types
@@ -0,0 +1,145 @@
+# Gunicorn configuration, loaded automatically from the working directory:
+#
+#     gunicorn azayd.wsgi:application
+#
+# Worker and thread counts are derived from the CPUs and memory actually
+# available to the container (cgroup limits first, then the host). Every value
+# can be overridden with the environment variables noted below.
+
+import math
+import os
+import threading
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+
+# === Resource Detection ===
+
+def _read(path):
+    try:
+        return Path(path).read_text().strip()
+    except OSError:
+        return None
+
+
+def detect_cpus():
+    # cgroup v2: "max 100000" or "<quota> <period>"
+    quota = _read('/sys/fs/cgroup/cpu.max')
+    if quota and not quota.startswith('max'):
+        limit, period = (int(part) for part in quota.split()[:2])
+        return max(1, math.ceil(limit / period))
+    # cgroup v1
+    limit, period = _read('/sys/fs/cgroup/cpu/cpu.cfs_quota_us'), _read('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    if limit and period and int(limit) > 0:
+        return max(1, math.ceil(int(limit) / int(period)))
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def detect_memory_mb():
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        limit = _read(path)
+        # v1 reports a huge number when unlimited
+        if limit and limit.isdigit() and int(limit) < 1 << 60:
+            return int(limit) // (1024 * 1024)
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+CPUS = detect_cpus()
+MEMORY_MB = detect_memory_mb()
+
+# Resident size of one worker after preload, used to cap the worker count
+WORKER_MEMORY_MB = int(os.getenv('GUNICORN_WORKER_MEMORY_MB', '160'))
+
+
+def default_workers():
+    workers = 2 * CPUS + 1
+    if MEMORY_MB:
+        # Leave a quarter of the memory for the master, page cache and spikes
+        workers = min(workers, max(1, int(MEMORY_MB * 0.75) // WORKER_MEMORY_MB))
+    return workers
+
+
+# === Server Settings ===
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# The Django apps live in backend/, next to the azayd settings package
+pythonpath = str(BASE_DIR / 'backend')
+chdir = str(BASE_DIR)
+
+# gthread workers: requests mostly wait on Postgres, SMTP and the Gemini API,
+# so each process serves several of them on threads. Set
+# GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker with azayd.asgi:application
+# to run the async views instead.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('WEB_CONCURRENCY', default_workers()))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# Import Django, the URLconf and every model once in the master; workers are
+# forked with it already loaded (and templates already compiled, see wsgi.py)
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+
+# Recycle workers to contain slow leaks; the jitter keeps them from all
+# restarting at the same moment
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can stall workers in containers
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+# === Hooks ===
+
+def when_ready(server):
+    server.log.info(
+        f"Detected {CPUS} CPUs and {MEMORY_MB or 'unknown'} MB; "
+        f"starting {workers} {worker_class} workers x {threads} threads"
+    )
+
+
+def pre_fork(server, worker):
+    # A connection opened while preloading must not be shared by forked workers
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    """Open database connections on every request thread before serving traffic."""
+    from website.warmup import warm_database_connections
+
+    pool = getattr(worker, 'tpool', None)
+    if pool is None:
+        # Sync workers serve requests on the main thread
+        warm_database_connections()
+        return
+
+    # Django connections are per thread: hold each pool thread at a barrier
+    # so every one of them runs the warm-up once
+    barrier = threading.Barrier(worker.cfg.threads, timeout=10)
+
+    def warm():
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        warm_database_connections()
+
+    for _ in range(worker.cfg.threads):
+        pool.submit(warm)